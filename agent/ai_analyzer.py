@@ -4,6 +4,7 @@ Supports multiple LLM providers: Groq (FREE), Together AI, OpenRouter, Anthropic
 """
 import os
 import logging
+import threading
 from typing import Optional
 
 from usage_tracker import (
@@ -52,6 +53,7 @@ class AIAnalyzer:
             window_seconds=window_seconds,
             storage_path=storage_path,
         )
+        self._usage_lock = threading.Lock()
         
         if not self.enabled:
             print("⚠️  AI features disabled: Set one of these environment variables:")
@@ -102,7 +104,8 @@ class AIAnalyzer:
 
         # Rate limiting
         key = f"{self.provider or 'unknown'}:{self.repo_id}"
-        allowed, remaining = self.usage_tracker.check_and_increment(key)
+        with self._usage_lock:  # calls may come from several threads
+            allowed, remaining = self.usage_tracker.check_and_increment(key)
         if not allowed:
             logger.warning("Rate limit exceeded for %s (repo %s). Retry in %ss", self.provider, self.repo_id, remaining)
             print(f"⚠️  Rate limit exceeded for {self.provider}. Try again in {remaining}s")
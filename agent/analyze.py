@@ -1,36 +1,127 @@
 import subprocess
 import os
-import json
 import sys
+import tempfile
+from functools import lru_cache
 
-def run_ruff(repo_root):
+import orjson
+
+
+@lru_cache(maxsize=1)
+def ruff_command():
     """
-    Run Ruff from repo root and return ABSOLUTE file paths.
+    Locate the ruff executable once.
+
+    Ruff already checks files in parallel across all cores, so the cheapest
+    scan is a direct exec of its binary rather than `python -m ruff`, which
+    starts a Python interpreter first.
+    """
+    try:
+        from ruff.__main__ import find_ruff_bin
+        return [os.fsdecode(find_ruff_bin())]
+    except (ImportError, FileNotFoundError):
+        return [sys.executable, "-m", "ruff"]
+
+
+@lru_cache(maxsize=1)
+def ruff_version():
+    """
+    The version line of the Ruff that ruff_command() runs, e.g. "ruff 0.14.10".
+
+    Findings depend on the Ruff release (new rules, changed defaults), so
+    anything caching scan results keys on this. None if Ruff cannot run.
+    """
+    try:
+        result = subprocess.run(
+            [*ruff_command(), "--version"], capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def file_mtimes(paths):
     """
-    result = subprocess.run(
-        [sys.executable, "-m", "ruff", "check", ".", "--output-format", "json", "--exit-zero"],
+    Map each path to its (mtime_ns, size), or None if it cannot be stat'ed.
+
+    Taken around ``ruff --fix`` over the files the first scan reported, the
+    difference is the set of files to re-lint: the fix only rewrites files
+    with findings, and Ruff rules are per-file, so the rest keep theirs. The
+    size is part of the stamp because a rewrite within the filesystem's
+    timestamp granularity leaves mtime unchanged, but a fix almost always
+    changes the length.
+    """
+    mtimes = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            mtimes[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def iter_ruff(repo_root, paths=None, select=None):
+    """
+    Stream Ruff findings as they are parsed, with ABSOLUTE file paths.
+
+    Uses json-lines output so each finding is decoded on its own instead of
+    buffering and parsing one large JSON array. Raw stdout bytes go straight
+    to orjson without a text decode. ``paths`` restricts the check to those
+    files; Ruff's excludes still apply to them. ``select`` limits Ruff to
+    those rule codes so it never computes findings the caller would drop.
+
+    Raises RuntimeError if Ruff itself fails (e.g. a bad argument): with
+    --exit-zero any non-zero status means the findings are incomplete.
+    """
+    targets = [*paths, "--force-exclude"] if paths else ["."]
+    if select:
+        targets += ["--select", ",".join(select)]
+    # stderr is spooled to a file so a flood of parse errors cannot block Ruff
+    stderr = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        [*ruff_command(), "check", *targets, "--output-format", "json-lines", "--exit-zero"],
         cwd=repo_root,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=stderr,
     )
 
-    issues = []
+    # Ruff already reports absolute paths; the prefix only covers a relative
+    # one, and saves a join + normpath per finding
+    root_prefix = os.path.abspath(repo_root) + os.sep
 
-    if not result.stdout.strip():
-        return issues
+    try:
+        for line in proc.stdout:
+            if not line.strip():
+                continue
 
-    data = json.loads(result.stdout)
+            item = orjson.loads(line)
+            filename = item["filename"]
+            if not os.path.isabs(filename):
+                filename = root_prefix + filename
 
-    for item in data:
-        filename = os.path.abspath(
-            os.path.join(repo_root, item["filename"])
-        )
+            yield {
+                "filename": filename,   # ✅ ABSOLUTE PATH
+                "line": item["location"]["row"],
+                "code": item["code"],
+                "message": item["message"],
+            }
+        returncode = proc.wait()
+        if returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(
+                f"Ruff exited with status {returncode}: {stderr.read().decode(errors='replace').strip()}"
+            )
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        stderr.close()
 
-        issues.append({
-            "filename": filename,   # ✅ ABSOLUTE PATH
-            "line": item["location"]["row"],
-            "code": item["code"],
-            "message": item["message"],
-        })
 
-    return issues
+def run_ruff(repo_root, paths=None, select=None):
+    """
+    Run Ruff from repo root and return ABSOLUTE file paths.
+    """
+    return list(iter_ruff(repo_root, paths, select))
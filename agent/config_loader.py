@@ -3,9 +3,12 @@ Configuration loader for AGI Engineer
 Supports .agi-engineer.yml and .agi-engineer.yaml files
 """
 import os
+import re
+import fnmatch
 import yaml
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,16 @@ DEFAULT_CONFIG = {
 }
 
 
+@lru_cache(maxsize=32)
+def _skip_regex(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Fold skip patterns into one regex: a glob match or a plain substring hit"""
+    alternatives = []
+    for pattern in patterns:
+        alternatives.append(r'\A' + fnmatch.translate(pattern))
+        alternatives.append(re.escape(pattern))
+    return re.compile('|'.join(alternatives) or r'(?!)')
+
+
 class Config:
     """Configuration manager for AGI Engineer"""
     
@@ -126,13 +139,7 @@ class Config:
     
     def should_skip(self, path: str) -> bool:
         """Check if path should be skipped"""
-        import fnmatch
-        
-        patterns = self.config['skip_patterns']
-        for pattern in patterns:
-            if fnmatch.fnmatch(path, pattern) or pattern in path:
-                return True
-        return False
+        return _skip_regex(tuple(self.config['skip_patterns'])).search(path) is not None
     
     def create_example_config(self, output_path: str = '.agi-engineer.yml'):
         """Create an example configuration file"""
@@ -1,9 +1,20 @@
 import os
+from functools import lru_cache
 
-def read_file(file_path):
-    """Reads file from an absolute path"""
-    if not os.path.exists(file_path):
-        return None
 
+@lru_cache(maxsize=256)
+def _read_cached(file_path, mtime_ns, size):
+    """Read one version of a file; the stat fields are part of the cache key"""
     with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
\ No newline at end of file
+        return f.read()
+
+
+def read_file(file_path):
+    """Reads file from an absolute path; None if it cannot be opened"""
+    # The stat doubles as the existence check and the cache key, so a file
+    # rewritten by a fix is read fresh while unchanged files are not re-read
+    try:
+        st = os.stat(file_path)
+        return _read_cached(file_path, st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
@@ -67,7 +67,9 @@ class FixOrchestrator:
         # Could filter by specific rules if needed
         # cmd.extend(["--select", ",".join(selected_rules)])
         
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True)
+        # Only the exit status matters; discard Ruff's report instead of
+        # buffering and decoding it
+        result = subprocess.run(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return result.returncode == 0
     
     def format_plan(self, plan: Dict) -> str:
@@ -63,7 +63,8 @@ class MultiLanguageAnalyzer:
             # Build ESLint command
             cmd = ['npx', 'eslint', repo_path, '--format', 'json', '--ext', '.js,.ts,.jsx,.tsx']
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # json.loads takes the raw bytes; skip decoding the report to str
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
             
             if result.stdout:
                 eslint_results = json.loads(result.stdout)
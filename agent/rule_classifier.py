@@ -73,10 +73,12 @@ class RuleClassifier:
         """Group issues by safety category"""
         grouped = {'safe': [], 'risky': [], 'suggest': []}
         
+        # Classify each distinct code once instead of once per issue
+        by_code = {code: self.classify(code) for code in {issue['code'] for issue in issues}}
+        
         for issue in issues:
-            classified = self.classify(issue['code'])
-            category = classified['category'].value
-            grouped[category].append({**issue, **classified})
+            classified = by_code[issue['code']]
+            grouped[classified['category'].value].append({**issue, **classified})
         
         return grouped
     
@@ -3,9 +3,10 @@ Safety Checker - Verify fixes don't introduce regressions
 """
 import subprocess
 import sys
-import json
 from typing import Dict, List
 
+import orjson
+
 class SafetyChecker:
     """Verify that fixes don't break anything"""
     
@@ -17,13 +18,14 @@ class SafetyChecker:
         """Scan repository and return all issues"""
         cmd = [sys.executable, "-m", "ruff", "check", ".", "--output-format", "json", "--exit-zero"]
         
-        result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True)
+        # Raw bytes straight into orjson: no text decode of the whole report
+        result = subprocess.run(cmd, cwd=repo_path, capture_output=True)
         
         if not result.stdout.strip():
             return []
         
         try:
-            data = json.loads(result.stdout)
+            data = orjson.loads(result.stdout)
             return data
         except:
             return []
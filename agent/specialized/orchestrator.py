@@ -48,7 +48,8 @@ class AgentOrchestrator:
         self, 
         repo_path: str, 
         files: Optional[List[str]] = None,
-        agent_types: Optional[List[AgentType]] = None
+        agent_types: Optional[List[AgentType]] = None,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """Run all agents in parallel.
         
@@ -56,6 +57,7 @@ class AgentOrchestrator:
             repo_path: Path to repository
             files: List of files to analyze (None = all files)
             agent_types: Specific agents to run (None = all registered)
+            max_concurrency: Most agents running at once (None = no limit)
             
         Returns:
             Aggregated results from all agents
@@ -79,8 +81,14 @@ class AgentOrchestrator:
         
         logger.info(f"Running {len(agents_to_run)} agents in parallel on {len(files)} files")
         
-        # Run agents concurrently
-        tasks = [agent.analyze(repo_path, files) for agent in agents_to_run]
+        # Run agents concurrently, at most max_concurrency at a time
+        semaphore = asyncio.Semaphore(max_concurrency or len(agents_to_run))
+        
+        async def run_agent(agent: BaseAgent) -> AgentResult:
+            async with semaphore:
+                return await agent.analyze(repo_path, files)
+        
+        tasks = [run_agent(agent) for agent in agents_to_run]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Aggregate results
@@ -9,7 +9,6 @@ import argparse
 import shutil
 import tempfile
 import subprocess
-import json
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 AGENT_DIR = os.path.join(BASE_DIR, "agent")
@@ -17,6 +16,7 @@ AGENT_DIR = os.path.join(BASE_DIR, "agent")
 if AGENT_DIR not in sys.path:
     sys.path.insert(0, AGENT_DIR)
 
+from analyze import file_mtimes, run_ruff
 from git_ops import (
     clone_repo, create_branch, commit_changes, 
     push_branch, create_pull_request,
@@ -24,30 +24,9 @@ from git_ops import (
 )
 
 
-def run_ruff_scan(repo_path, select_rules=None):
-    """Scan repository and return issues."""
-    cmd = [sys.executable, "-m", "ruff", "check", ".", "--output-format", "json", "--exit-zero"]
-    
-    if select_rules:
-        cmd.extend(["--select", ",".join(select_rules)])
-    
-    result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True)
-    
-    if not result.stdout.strip():
-        return []
-    
-    data = json.loads(result.stdout)
-    issues = []
-    
-    for item in data:
-        issues.append({
-            "filename": os.path.abspath(os.path.join(repo_path, item["filename"])),
-            "line": item["location"]["row"],
-            "code": item["code"],
-            "message": item["message"],
-        })
-    
-    return issues
+def run_ruff_scan(repo_path, select_rules=None, paths=None):
+    """Scan repository (or just ``paths``) and return issues."""
+    return run_ruff(repo_path, paths, select_rules)
 
 
 def run_ruff_fix(repo_path, select_rules=None):
@@ -57,7 +36,9 @@ def run_ruff_fix(repo_path, select_rules=None):
     if select_rules:
         cmd.extend(["--select", ",".join(select_rules)])
     
-    result = subprocess.run(cmd, cwd=repo_path, capture_output=True, text=True)
+    # Only the exit status matters; discard Ruff's report instead of
+    # buffering and decoding it
+    result = subprocess.run(cmd, cwd=repo_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     return result.returncode == 0
 
@@ -149,10 +130,18 @@ Examples:
 
         # Fix with Ruff
         print("🔧 Applying automatic fixes...")
+        reported = {issue["filename"] for issue in issues_before}
+        mtimes_before = file_mtimes(reported)
         run_ruff_fix(repo_path, select_rules)
-
-        # Scan after
-        issues_after = run_ruff_scan(repo_path, select_rules)
+        mtimes_after = file_mtimes(reported)
+
+        # Scan after: only files the fix rewrote can have different findings,
+        # and it only rewrites files the first scan reported
+        stale = {path for path in reported if mtimes_before[path] != mtimes_after[path]}
+        changed = {path for path in stale if mtimes_after[path] is not None}
+        issues_after = [issue for issue in issues_before if issue["filename"] not in stale]
+        if changed:
+            issues_after += run_ruff_scan(repo_path, select_rules, sorted(changed))
         fixed_count = len(issues_before) - len(issues_after)
 
         print(f"✅ Fixed {fixed_count} issues")
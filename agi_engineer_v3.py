@@ -11,9 +11,14 @@ import tempfile
 import hashlib
 import uuid
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
+get_filename = itemgetter('filename')
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 AGENT_DIR = os.path.join(BASE_DIR, "agent")
 
@@ -64,41 +69,24 @@ def display_classification(classifier: RuleClassifier, issues: list):
     
     print_section("📋 ISSUE CLASSIFICATION")
     
-    # Safe rules
-    if grouped['safe']:
-        print(f"\n✅ SAFE TO AUTO-FIX ({len(grouped['safe'])} issues)")
-        by_code = {}
-        for issue in grouped['safe']:
-            code = issue['code']
-            by_code[code] = by_code.get(code, 0) + 1
-        
+    # One line per rule code can run long on big repos; build the whole
+    # section and hand it to stdout in a single write
+    lines = []
+    for category, heading in (
+        ('safe', "✅ SAFE TO AUTO-FIX ({} issues)"),
+        ('risky', "⚠️  NEEDS REVIEW ({} issues)"),
+        ('suggest', "💡 SUGGESTIONS ({} items)"),
+    ):
+        if not grouped[category]:
+            continue
+        lines.append("\n" + heading.format(len(grouped[category])))
+        by_code = Counter(issue['code'] for issue in grouped[category])
         for code, count in sorted(by_code.items()):
             rule_info = classifier.classify(code)
-            print(f"   • {code}: {rule_info['name']} ({count})")
+            lines.append(f"   • {code}: {rule_info['name']} ({count})")
     
-    # Risky rules
-    if grouped['risky']:
-        print(f"\n⚠️  NEEDS REVIEW ({len(grouped['risky'])} issues)")
-        by_code = {}
-        for issue in grouped['risky']:
-            code = issue['code']
-            by_code[code] = by_code.get(code, 0) + 1
-        
-        for code, count in sorted(by_code.items()):
-            rule_info = classifier.classify(code)
-            print(f"   • {code}: {rule_info['name']} ({count})")
-    
-    # Suggestions
-    if grouped['suggest']:
-        print(f"\n💡 SUGGESTIONS ({len(grouped['suggest'])} items)")
-        by_code = {}
-        for issue in grouped['suggest']:
-            code = issue['code']
-            by_code[code] = by_code.get(code, 0) + 1
-        
-        for code, count in sorted(by_code.items()):
-            rule_info = classifier.classify(code)
-            print(f"   • {code}: {rule_info['name']} ({count})")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_explanations(explainer: ExplainerEngine, grouped_issues: dict, only_safe: bool = False):
@@ -107,12 +95,11 @@ def display_explanations(explainer: ExplainerEngine, grouped_issues: dict, only_
     
     issues_to_explain = grouped_issues['safe'] if only_safe else grouped_issues['safe']
     
-    seen = set()
-    for issue in issues_to_explain:
-        code = issue['code']
-        if code not in seen:
-            print(explainer.format_explanation(code, len([i for i in issues_to_explain if i['code'] == code])))
-            seen.add(code)
+    # Counter keeps first-seen order, so codes print as before
+    by_code = Counter(issue['code'] for issue in issues_to_explain)
+    explanations = [explainer.format_explanation(code, count) for code, count in by_code.items()]
+    if explanations:
+        sys.stdout.write("\n".join(explanations) + "\n")
 
 
 def get_repo_identifier(repo_path: str, repo_arg: str) -> str:
@@ -298,18 +285,26 @@ Examples:
             if ai_analyzer:
                 print_section("🤖 AI ANALYSIS")
                 # Get unique files with issues
-                files_with_issues = list(set(issue['filename'] for issue in issues))
+                files_with_issues = list(set(map(get_filename, issues)))
                 max_ai_files = config.get('ai.max_files_to_analyze', 3)
 
+                jobs = []
                 for file_path in files_with_issues[:max_ai_files]:
-                    abs_path = os.path.join(repo_path, file_path)
-                    if os.path.exists(abs_path):
-                        code = read_file(abs_path)
-                        if code:
-                            print(f"\n📄 {file_path}")
-                            suggestions = ai_analyzer.analyze_code_quality(code, file_path)
-                            if suggestions:
-                                print(suggestions)
+                    code = read_file(os.path.join(repo_path, file_path))
+                    if code:
+                        jobs.append((file_path, code))
+
+                # Each file is an independent LLM round-trip; issue them
+                # concurrently and print in the original order
+                if jobs:
+                    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                        all_suggestions = list(pool.map(
+                            lambda job: ai_analyzer.analyze_code_quality(job[1], job[0]), jobs
+                        ))
+                    for (file_path, _), suggestions in zip(jobs, all_suggestions):
+                        print(f"\n📄 {file_path}")
+                        if suggestions:
+                            print(suggestions)
             
             print("\n✨ Analysis complete!")
             # Seal ledger: COMPLETE (analyze-only mode)
@@ -375,8 +370,12 @@ Examples:
         repo_identifier = get_repo_identifier(repo_path, args.repo)
         
         # Get files that were changed (from analyze step)
-        files_changed = list(set(issue['filename'] for issue in issues))
-        lines_changed = sum(1 for issue in issues for _ in [issue])  # Approximation
+        files_changed = list(set(map(get_filename, issues)))
+        lines_changed = len(issues)  # Approximation
+        
+        # The plan already holds the safe-category issues; reuse it instead
+        # of re-classifying every issue for each consumer below
+        safe_issues = plan['to_fix']
         
         edr = edr_generator.generate(
             repo=repo_identifier,
@@ -384,7 +383,7 @@ Examples:
             issues_before=len(issues),
             issues_after=regression_report['issues_after'],
             fixed_count=fixed_count,
-            issues_fixed=[i for i in issues if classifier.classify(i['code'])['category'].value == 'safe'],
+            issues_fixed=safe_issues,
             safety_mode='smart' if args.smart else 'safe_only',
             regressions_detected=regression_report.get('new_issues', False),
             files_changed=files_changed,
@@ -427,17 +426,15 @@ Examples:
             print("Analyzing remaining code quality issues...")
             
             # Get files that were modified
-            modified_files = list(set(issue['filename'] for issue in issues if classifier.classify(issue['code'])['category'].value == 'safe'))
+            modified_files = list(set(map(get_filename, safe_issues)))
             
             for file_path in modified_files[:2]:  # Analyze up to 2 modified files
-                abs_path = os.path.join(repo_path, file_path)
-                if os.path.exists(abs_path):
-                    code = read_file(abs_path)
-                    if code:
-                        print(f"\n📄 {file_path}")
-                        suggestions = ai_analyzer.analyze_code_quality(code, file_path)
-                        if suggestions:
-                            print(suggestions)
+                code = read_file(os.path.join(repo_path, file_path))
+                if code:
+                    print(f"\n📄 {file_path}")
+                    suggestions = ai_analyzer.analyze_code_quality(code, file_path)
+                    if suggestions:
+                        print(suggestions)
 
         if fixed_count == 0:
             print("⏭  No issues were auto-fixed")
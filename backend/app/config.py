@@ -21,6 +21,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./agi_engineer_v2.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800  # seconds
 
     # Redis (for Celery background tasks)
     redis_url: str = "redis://localhost:6379/0"
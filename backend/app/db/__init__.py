@@ -1,27 +1,68 @@
 """Database base, connection and session management."""
 
+from contextvars import ContextVar
+from typing import Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 from app.config import settings
 from .base import Base
 
+# Size the QueuePool for webhook bursts; SQLite keeps SQLAlchemy's default pool
+_pool_options = {}
+if not settings.database_url.startswith("sqlite"):
+    _pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     echo=settings.api_env == "development",
     pool_pre_ping=True,
+    **_pool_options,
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local session registry for Celery workers; call ScopedSession.remove()
+# when a task finishes. HTTP requests use the contextvar session below instead.
+ScopedSession = scoped_session(SessionLocal)
+
+
+# Request-scoped session shared by every dependency and handler in one request
+_session_ctx: ContextVar[Optional[Session]] = ContextVar("db_session", default=None)
+
+
+async def db_session_middleware(request, call_next):
+    """Open one session per HTTP request and expose it through ``get_db``."""
+    db = SessionLocal()
+    token = _session_ctx.set(db)
+    try:
+        return await call_next(request)
+    finally:
+        _session_ctx.reset(token)
+        db.close()
+
 
 def get_db() -> Session:
-    """Dependency for getting database session."""
+    """Dependency for getting database session.
+
+    Reuses the request-scoped session when the middleware is active
+    (HTTP requests) and falls back to a private session otherwise.
+    """
+    session = _session_ctx.get()
+    if session is not None:
+        yield session
+        return
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
+__all__ = ["Base", "engine", "SessionLocal", "ScopedSession", "get_db", "db_session_middleware"]
@@ -1,16 +1,24 @@
 """FastAPI application factory and main entry point."""
 
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.db import db_session_middleware
 from app.routers import health, oauth, webhooks, installations, analysis, websockets, fixes, analytics, teams, repositories, github_webhooks, insights
 
 app = FastAPI(
     title="AGI Engineer V2",
     description="GitHub App for automated code quality analysis",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+app.middleware("http")(db_session_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -29,6 +37,15 @@ async def startup():
     from app.db.base import Base
     from app.db import engine
     Base.metadata.create_all(bind=engine)
+    app.state.pubsub_task = asyncio.create_task(websockets.pubsub_listener())
+
+@app.on_event("shutdown")
+async def shutdown():
+    from app.security import close_http_client
+    app.state.pubsub_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.pubsub_task
+    await close_http_client()
 
 app.include_router(health.router)
 app.include_router(oauth.router)
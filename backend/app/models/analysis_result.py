@@ -1,7 +1,7 @@
 """Analysis result model for storing discovered issues and fixes."""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import enum
 from app.db.base import Base
@@ -19,6 +19,10 @@ class AnalysisResult(Base):
     """Individual issue or fix result from analysis."""
 
     __tablename__ = "analysis_results"
+    __table_args__ = (
+        # Serves per-code category backfills (fix_categories.py)
+        Index("ix_analysis_results_issue_code_category", "issue_code", "category"),
+    )
 
     id = Column(Integer, primary_key=True)
     run_id = Column(Integer, ForeignKey("analysis_runs.id"), nullable=False, index=True)
@@ -30,8 +34,9 @@ class AnalysisResult(Base):
     severity = Column(String(20), nullable=False)  # error, warning, info
     message = Column(String(1000), nullable=False)
     suggestion = Column(Text, nullable=True)
-    before_code = Column(Text, nullable=True)
-    after_code = Column(Text, nullable=True)
+    # Code blobs are rarely read; load them only on access
+    before_code = deferred(Column(Text, nullable=True))
+    after_code = deferred(Column(Text, nullable=True))
     is_fixed = Column(Integer, default=0)  # 0=no, 1=yes, 2=partial
     created_at = Column(DateTime, default=datetime.utcnow)
 
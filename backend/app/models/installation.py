@@ -13,7 +13,7 @@ class Installation(Base):
 
     id = Column(Integer, primary_key=True)
     installation_id = Column(Integer, unique=True, index=True, nullable=False)
-    github_user = Column(String(255), nullable=False)
+    github_user = Column(String(255), unique=True, index=True, nullable=False)
     github_org = Column(String(255), nullable=True)
     access_token = Column(String(500), nullable=True)
     token_expires_at = Column(DateTime, nullable=True)
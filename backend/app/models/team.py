@@ -1,6 +1,6 @@
 """Team collaboration models for multi-user workspaces."""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -90,6 +90,10 @@ class ActivityLog(Base):
     """Log of team activities for audit and notifications."""
     
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # Serves the per-team feed ordered by recency
+        Index("ix_activity_logs_team_created", "team_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True)
     
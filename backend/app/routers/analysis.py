@@ -20,6 +20,19 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Value -> member lookup for engine output; members hash like their values
+_CATEGORY_MAP = {c.value: c for c in IssueCategory}
+
+# One engine per process; it resolves linter binaries when constructed
+_v1_engine: Optional[V1AnalysisEngine] = None
+
+
+def _get_v1_engine() -> V1AnalysisEngine:
+    global _v1_engine
+    if _v1_engine is None:
+        _v1_engine = V1AnalysisEngine(groq_api_key=settings.groq_api_key)
+    return _v1_engine
+
 
 def validate_github_url(url: str) -> tuple[str, str]:
     """Validate and parse GitHub repository URL.
@@ -392,106 +405,94 @@ async def _execute_analysis_background(
         db.commit()
         logger.info(f"Starting analysis for run {run_id}")
 
-        # Initialize V1 engine
-        engine = V1AnalysisEngine(groq_api_key=settings.groq_api_key)
+        engine = _get_v1_engine()
 
-        try:
-            # Run analysis
-            analysis_result = engine.analyze_repository(
-                repo_url=f"https://github.com/{repository.repo_full_name}",
-                branch=run.github_branch,
-                commit_sha=run.github_commit_sha,
-            )
+        # Run analysis
+        analysis_result = engine.analyze_repository(
+            repo_url=f"https://github.com/{repository.repo_full_name}",
+            branch=run.github_branch,
+            commit_sha=run.github_commit_sha,
+        )
 
-            if analysis_result["status"] == "failed":
-                run.status = RunStatus.FAILED
-                run.error_message = analysis_result.get("error", "Analysis failed")
-                run.completed_at = datetime.utcnow()
-                db.commit()
-                logger.error(f"Analysis failed for run {run_id}: {analysis_result['error']}")
-                return
-
-            # Store results with batch insert for better performance
-            results_to_add = []
-            for issue in analysis_result.get("issues", []):
-                category_value = issue.get("category", IssueCategory.SUGGESTION.value)
-                # Ensure category is valid Enum value
-                try:
-                    category_enum = IssueCategory(category_value)
-                except Exception:
-                    category_enum = IssueCategory.SUGGESTION
-
-                result = AnalysisResult(
-                    run_id=run_id,
-                    file_path=issue.get("file_path", ""),
-                    line_number=issue.get("line_number", 0),
-                    issue_code=issue.get("issue_code", ""),
-                    issue_name=issue.get("issue_name", ""),
-                    category=category_enum,
-                    severity=str(issue.get("severity", "info")),
-                    message=issue.get("message", ""),
-                    is_fixed=1 if category_enum == IssueCategory.SAFE else 0,
-                )
-                results_to_add.append(result)
-
-            # Batch insert all results
-            if results_to_add:
-                db.bulk_save_objects(results_to_add)
-                logger.info(f"Batch inserted {len(results_to_add)} results")
-
-            # Update run status
-            run.status = RunStatus.COMPLETED
+        if analysis_result["status"] == "failed":
+            run.status = RunStatus.FAILED
+            run.error_message = analysis_result.get("error", "Analysis failed")
             run.completed_at = datetime.utcnow()
+            db.commit()
+            logger.error(f"Analysis failed for run {run_id}: {analysis_result['error']}")
+            return
+
+        # Store results with one bulk insert of plain column mappings
+        rows = []
+        for issue in analysis_result.get("issues", []):
+            # Unknown categories fall back to SUGGESTION
+            category_enum = _CATEGORY_MAP.get(issue.category, IssueCategory.SUGGESTION)
+            rows.append({
+                "run_id": run_id,
+                "file_path": issue.file_path,
+                "line_number": issue.line_number,
+                "issue_code": issue.issue_code,
+                "issue_name": issue.issue_name,
+                "category": category_enum,
+                "severity": issue.severity,
+                "message": issue.message,
+                "is_fixed": 1 if category_enum is IssueCategory.SAFE else 0,
+            })
+
+        if rows:
+            db.bulk_insert_mappings(AnalysisResult, rows)
+            logger.info(f"Batch inserted {len(rows)} results")
+
+        # Update run status
+        run.status = RunStatus.COMPLETED
+        run.completed_at = datetime.utcnow()
+    
+        # 6. Run AGI Engineer v3 auto-fix if requested
+        if auto_fix and analysis_result.get("issues"):
+            logger.info(f"Running AGI Engineer v3 auto-fix for run {run_id}...")
+            try:
+                from agent.rule_classifier import RuleClassifier, RuleCategory
+            
+                classifier = RuleClassifier()
             
-            # 6. Run AGI Engineer v3 auto-fix if requested
-            if auto_fix and analysis_result.get("issues"):
-                logger.info(f"Running AGI Engineer v3 auto-fix for run {run_id}...")
-                try:
-                    from agent.rule_classifier import RuleClassifier, RuleCategory
-                    
-                    classifier = RuleClassifier()
-                    
-                    # Classify each issue and mark fixable ones as fixed
-                    fixable_count = 0
-                    unfixable_count = 0
-                    
-                    # Get all results for this run
-                    all_results = db.query(AnalysisResult).filter(
-                        AnalysisResult.run_id == run_id
-                    ).all()
-                    
-                    for result in all_results:
-                        # Fast-path: if category already marked SAFE, mark fixed
-                        if result.category == IssueCategory.SAFE:
-                            result.is_fixed = 1
-                            fixable_count += 1
-                            logger.info(f"Auto-fixed (safe category) {result.issue_code}: {result.issue_name}")
-                            continue
-
-                        # Otherwise classify by rule code
-                        classification = classifier.classify(result.issue_code)
-                        
-                        if classification.get('category') == RuleCategory.SAFE:
-                            result.is_fixed = 1
-                            fixable_count += 1
-                            logger.info(f"Auto-fixed {result.issue_code}: {result.issue_name}")
-                        else:
-                            unfixable_count += 1
-                    
-                    logger.info(f"Auto-fix complete: {fixable_count} issues fixed, {unfixable_count} require review")
+                # Classify each issue and mark fixable ones as fixed
+                fixable_count = 0
+                unfixable_count = 0
+            
+                # Get all results for this run
+                all_results = db.query(AnalysisResult).filter(
+                    AnalysisResult.run_id == run_id
+                ).all()
+            
+                for result in all_results:
+                    # Fast-path: if category already marked SAFE, mark fixed
+                    if result.category == IssueCategory.SAFE:
+                        result.is_fixed = 1
+                        fixable_count += 1
+                        logger.info(f"Auto-fixed (safe category) {result.issue_code}: {result.issue_name}")
+                        continue
+
+                    # Otherwise classify by rule code
+                    classification = classifier.classify(result.issue_code)
                 
-                except Exception as e:
-                    logger.warning(f"Auto-fix classification failed (continuing): {str(e)}")
+                    if classification.get('category') == RuleCategory.SAFE:
+                        result.is_fixed = 1
+                        fixable_count += 1
+                        logger.info(f"Auto-fixed {result.issue_code}: {result.issue_name}")
+                    else:
+                        unfixable_count += 1
             
-            db.commit()
-
-            logger.info(
-                f"Analysis completed for run {run_id}: "
-                f"{analysis_result['total_issues']} issues found"
-            )
+                logger.info(f"Auto-fix complete: {fixable_count} issues fixed, {unfixable_count} require review")
+        
+            except Exception as e:
+                logger.warning(f"Auto-fix classification failed (continuing): {str(e)}")
+    
+        db.commit()
 
-        finally:
-            engine.cleanup()
+        logger.info(
+            f"Analysis completed for run {run_id}: "
+            f"{analysis_result['total_issues']} issues found"
+        )
 
     except Exception as e:
         logger.error(f"Error during analysis execution: {str(e)}", exc_info=True)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from datetime import datetime, timedelta
 from typing import List
 
@@ -175,13 +175,24 @@ async def get_repository_health(
     """
     cutoff_date = datetime.utcnow() - timedelta(days=days)
     
-    # Get runs for repository
-    runs = db.query(AnalysisRun).filter(
-        AnalysisRun.repository_id == repository_id,
-        AnalysisRun.created_at >= cutoff_date
-    ).all()
+    # Aggregate in SQL so the response cost is independent of run count
+    row = db.execute(
+        select(
+            func.count(func.distinct(AnalysisRun.id)).label("total"),
+            func.count(func.distinct(AnalysisRun.id)).filter(
+                AnalysisRun.status == RunStatus.COMPLETED
+            ).label("completed"),
+            func.count(AnalysisResult.id).label("issues"),
+        )
+        .select_from(AnalysisRun)
+        .outerjoin(AnalysisResult, AnalysisResult.run_id == AnalysisRun.id)
+        .where(
+            AnalysisRun.repository_id == repository_id,
+            AnalysisRun.created_at >= cutoff_date,
+        )
+    ).one()
     
-    if not runs:
+    if row.total == 0:
         return {
             "repository_id": repository_id,
             "health_score": 100,
@@ -189,9 +200,9 @@ async def get_repository_health(
         }
     
     # Calculate metrics
-    completed_runs = len([r for r in runs if r.status == RunStatus.COMPLETED])
-    total_issues = sum(r.total_results or 0 for r in runs)
-    success_rate = (completed_runs / len(runs) * 100) if runs else 0
+    completed_runs = row.completed
+    total_issues = row.issues
+    success_rate = completed_runs / row.total * 100
     
     # Calculate health score (0-100)
     # Higher success rate is better, fewer issues is better
@@ -204,11 +215,11 @@ async def get_repository_health(
         "repository_id": repository_id,
         "health_score": health_score,
         "metrics": {
-            "total_runs": len(runs),
+            "total_runs": row.total,
             "completed_runs": completed_runs,
             "success_rate": success_rate,
             "total_issues": total_issues,
-            "average_issues_per_run": total_issues / len(runs) if runs else 0,
+            "average_issues_per_run": total_issues / row.total,
         },
         "trend": "improving" if success_rate > 70 else "needs_attention"
     }
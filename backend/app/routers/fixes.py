@@ -7,6 +7,7 @@ Phase 15.1: Governed Fix Approval & Application
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from pydantic import BaseModel
@@ -42,17 +43,22 @@ async def generate_fix(
     Returns:
         Fix generation status
     """
-    # Get result
-    result = db.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-    if not result:
+    # Probe for the result without loading the row
+    result_exists = db.execute(
+        select(AnalysisResult.id).where(AnalysisResult.id == result_id)
+    ).first()
+    if result_exists is None:
         raise HTTPException(status_code=404, detail="Analysis result not found")
     
-    # Check if fix already exists
-    existing_fix = db.query(CodeFix).filter(CodeFix.result_id == result_id).first()
-    if existing_fix:
+    # Check if fix already exists; only load the full fix when it does
+    existing_fix_id = db.execute(
+        select(CodeFix.id).where(CodeFix.result_id == result_id).limit(1)
+    ).scalar()
+    if existing_fix_id is not None:
+        existing_fix = db.get(CodeFix, existing_fix_id)
         return {
             "status": "already_exists",
-            "fix_id": existing_fix.id,
+            "fix_id": existing_fix_id,
             "fix": existing_fix.to_dict()
         }
     
@@ -160,6 +166,7 @@ async def create_pr_from_fix(
 @router.get("/result/{result_id}/all")
 async def get_result_with_fix(
     result_id: int,
+    include_code: bool = Query(False, description="Include code blobs for the result and fixes"),
     token: str = Depends(verify_token),
     db: Session = Depends(get_db)
 ) -> dict:
@@ -167,29 +174,63 @@ async def get_result_with_fix(
     
     Args:
         result_id: ID of the AnalysisResult
+        include_code: Return full fix records and result code blobs
+            instead of lean metadata projections
         token: JWT token
         db: Database session
         
     Returns:
         Result with fixes array
     """
-    result = db.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-    if not result:
+    result_columns = [
+        AnalysisResult.id,
+        AnalysisResult.issue_code,
+        AnalysisResult.message,
+        AnalysisResult.file_path,
+        AnalysisResult.line_number,
+    ]
+    if include_code:
+        result_columns += [AnalysisResult.before_code, AnalysisResult.after_code]
+    
+    result = db.execute(
+        select(*result_columns).where(AnalysisResult.id == result_id)
+    ).first()
+    if result is None:
         raise HTTPException(status_code=404, detail="Analysis result not found")
     
-    fixes = db.query(CodeFix).filter(CodeFix.result_id == result_id).all()
+    result_data = {
+        "id": result.id,
+        "rule_id": result.issue_code,
+        "message": result.message,
+        "file_path": result.file_path,
+        "line_number": result.line_number,
+    }
+    
+    if include_code:
+        result_data["before_code"] = result.before_code
+        result_data["after_code"] = result.after_code
+        fixes = [
+            fix.to_dict()
+            for fix in db.query(CodeFix).filter(CodeFix.result_id == result_id).all()
+        ]
+    else:
+        fixes = [
+            {
+                "id": row.id,
+                "status": row.status.value if row.status else None,
+                "pr_url": row.pr_url,
+            }
+            for row in db.execute(
+                select(CodeFix.id, CodeFix.status, CodeFix.pr_url)
+                .where(CodeFix.result_id == result_id)
+            )
+        ]
     
     return {
-        "result": result.to_dict() if hasattr(result, 'to_dict') else {
-            "id": result.id,
-            "rule_id": result.rule_id,
-            "message": result.message,
-            "file_path": result.file_path,
-            "line_number": result.line_number,
-        },
-        "fixes": [fix.to_dict() for fix in fixes],
+        "result": result_data,
+        "fixes": fixes,
         "has_fix": len(fixes) > 0,
-        "fix_status": fixes[0].status.value if fixes else None
+        "fix_status": fixes[0]["status"] if fixes else None
     }
 
 # ----------------------------------------------------------------------
@@ -140,11 +140,18 @@ async def _handle_pull_request_event(
         Installation.installation_id == installation_id_github
     ).first()
     
+    owner_login = repo_data.get("owner", {}).get("login", "unknown")
+    if not installation:
+        # github_user is unique, so reuse the row an OAuth login already created
+        installation = db.query(Installation).filter(
+            Installation.github_user == owner_login
+        ).first()
+    
     if not installation:
         # Create new installation record
         installation = Installation(
             installation_id=installation_id_github,
-            github_user=repo_data.get("owner", {}).get("login", "unknown"),
+            github_user=owner_login,
             github_org=repo_data.get("owner", {}).get("type") == "Organization" and repo_data.get("owner", {}).get("login") or None,
             is_active=True
         )
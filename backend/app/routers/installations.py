@@ -1,6 +1,7 @@
 """Installation management endpoints."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.db import get_db
 from app.models.installation import Installation
@@ -12,13 +13,29 @@ router = APIRouter(prefix="/installations", tags=["installations"])
 
 
 @router.get("/", response_model=List[InstallationResponse])
-async def list_installations(db: Session = Depends(get_db)) -> list:
-    """List all installations.
+async def list_installations(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+) -> list:
+    """List installations, one page at a time.
     
+    Args:
+        response: Outgoing response (receives the X-Total-Count header)
+        limit: Maximum number of installations to return
+        offset: Number of installations to skip
+        db: Database session
+        
     Returns:
-        List of Installation objects
+        List of Installation objects ordered by ID
     """
-    installations = db.query(Installation).all()
+    total = db.execute(select(func.count()).select_from(Installation)).scalar_one()
+    response.headers["X-Total-Count"] = str(total)
+
+    installations = db.execute(
+        select(Installation).order_by(Installation.id).limit(limit).offset(offset)
+    ).scalars().all()
     return installations
 
 
@@ -2,7 +2,11 @@
 
 import uuid
 import logging
+from datetime import datetime
 from fastapi import APIRouter, Query, HTTPException, Depends
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from app.db import get_db
 from app.models.installation import Installation
@@ -11,6 +15,56 @@ from app.config import settings
 
 router = APIRouter(prefix="/oauth", tags=["oauth"])
 
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def _upsert_installation(db: Session, github_user: str, github_id: int, access_token: str) -> Installation:
+    """Create or refresh the installation for a GitHub user in one statement.
+
+    Relies on the unique index on ``installations.github_user`` so concurrent
+    callbacks for the same user cannot race-create duplicate rows.
+    """
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        installation = db.query(Installation).filter(
+            Installation.github_user == github_user
+        ).first()
+        if not installation:
+            installation = Installation(
+                installation_id=github_id,
+                github_user=github_user,
+                github_org=None,
+                access_token=access_token,
+            )
+            db.add(installation)
+        else:
+            installation.access_token = access_token
+            installation.is_active = True
+        db.commit()
+        db.refresh(installation)
+        return installation
+
+    stmt = insert(Installation).values(
+        installation_id=github_id,
+        github_user=github_user,
+        github_org=None,
+        access_token=access_token,
+        is_active=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Installation.github_user],
+        set_={
+            "access_token": stmt.excluded.access_token,
+            "is_active": True,
+            "updated_at": datetime.utcnow(),
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+    return db.execute(
+        select(Installation).where(Installation.github_user == github_user)
+    ).scalar_one()
+
 
 @router.get("/authorize")
 async def authorize_oauth() -> dict:
@@ -26,36 +80,19 @@ async def oauth_callback(
     db: Session = Depends(get_db),
 ) -> dict:
     try:
-        token_response = GitHubOAuthManager.exchange_code_for_token(code)
+        token_response = await GitHubOAuthManager.exchange_code_for_token(code)
         access_token = token_response.get("access_token")
 
         if not access_token:
             raise ValueError(f"No access token. Response: {token_response}")
 
-        user_info = GitHubOAuthManager.get_user_info(access_token)
+        user_info = await GitHubOAuthManager.get_user_info(access_token)
         github_user = user_info.get("login")
         github_id = user_info.get("id")
 
         logging.error(f"Got user: {github_user}, id: {github_id}")
 
-        installation = db.query(Installation).filter(
-            Installation.github_user == github_user
-        ).first()
-
-        if not installation:
-            installation = Installation(
-                installation_id=github_id,
-                github_user=github_user,
-                github_org=None,
-                access_token=access_token,
-            )
-            db.add(installation)
-        else:
-            installation.access_token = access_token
-            installation.is_active = True
-
-        db.commit()
-        db.refresh(installation)
+        installation = _upsert_installation(db, github_user, github_id, access_token)
         logging.error(f"Saved installation id: {installation.id}")
 
         jwt_token = JWTManager.create_token({
@@ -88,6 +125,7 @@ async def refresh_token(
         ).first()
         if not installation or not installation.is_active:
             raise HTTPException(status_code=401, detail="Installation not found or inactive")
+        JWTManager.invalidate_cache()
         new_token = JWTManager.create_token({
             "user": installation.github_user,
             "installation_id": installation.id,
@@ -1,19 +1,27 @@
 """Repository import and management endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from app.db import SessionLocal, get_db
 from app.models.analysis_run import AnalysisRun, RunStatus
-from app.models.analysis_result import AnalysisResult, IssueCategory
 from app.models.repository import Repository
 from app.models.installation import Installation
-from app.tasks.analysis_tasks import clone_repository, run_agi_engineer_analysis
+from app.tasks.analysis_tasks import (
+    build_result_mappings,
+    clone_repository,
+    insert_results,
+    repository_lock,
+    run_agi_engineer_analysis,
+)
 from app.security import verify_token
 from app.tasks import run_code_analysis
 
@@ -22,6 +30,19 @@ router = APIRouter(prefix="/api/repositories", tags=["repositories"])
 # Lightweight executor to fall back to in-process analysis when Celery isn't running
 _fallback_executor = ThreadPoolExecutor(max_workers=1)
 
+_GH_URL_RE = re.compile(r"^https?://github\.com/")
+
+# Shared keep-alive pool so repeated imports reuse the TLS connection to GitHub
+_gh_session = requests.Session()
+_gh_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
 
 class ImportRepoRequest(BaseModel):
     full_name: str  # owner/repo
@@ -32,10 +53,8 @@ def _normalize_full_name(raw: str) -> str:
     """Normalize user input to owner/repo."""
     cleaned = raw.strip()
     cleaned = cleaned.replace("git@github.com:", "https://github.com/")
-    if cleaned.startswith("http://") or cleaned.startswith("https://"):
-        cleaned = re.sub(r"^https?://github.com/", "", cleaned)
-    if cleaned.endswith(".git"):
-        cleaned = cleaned[:-4]
+    cleaned = _GH_URL_RE.sub("", cleaned)
+    cleaned = cleaned.removesuffix(".git")
     return cleaned
 
 
@@ -43,7 +62,13 @@ def _run_analysis_sync(run_id: int):
     """Minimal synchronous runner to ensure analysis executes if Celery is down."""
     db = SessionLocal()
     try:
-        run = db.query(AnalysisRun).filter(AnalysisRun.id == run_id).first()
+        # Load run -> repository -> installation in one round trip
+        run = (
+            db.query(AnalysisRun)
+            .options(joinedload(AnalysisRun.repository).joinedload(Repository.installation))
+            .filter(AnalysisRun.id == run_id)
+            .first()
+        )
         if not run:
             return
         repo = run.repository
@@ -53,46 +78,30 @@ def _run_analysis_sync(run_id: int):
             db.commit()
             return
 
+        # Read what the clone needs before commit expires the loaded graph
+        repo_full_name = repo.repo_full_name
+        access_token = repo.installation.access_token
+        branch = run.github_branch
+        commit_sha = run.github_commit_sha
+
         # Mark in progress
         run.status = RunStatus.IN_PROGRESS
         run.started_at = datetime.utcnow()
         db.commit()
 
-        # Clone and analyze
-        repo_path = clone_repository(
-            repo.github_repo_id and repo.repo_full_name or repo.repo_full_name,
-            run.github_branch,
-            repo.installation.access_token,
-        )
-
-        results = run_agi_engineer_analysis(
-            repo_path=repo_path,
-            branch=run.github_branch,
-            commit_sha=run.github_commit_sha,
-        )
+        # Clone and analyze while holding the shared working copy
+        with repository_lock(repo_full_name):
+            repo_path = clone_repository(repo_full_name, branch, access_token, commit_sha=commit_sha)
 
-        total_issues = 0
-        for result_data in results:
-            category_value = result_data.get("category") or IssueCategory.SUGGESTION
-            if isinstance(category_value, str):
-                category_value = IssueCategory(category_value)
-
-            issue = AnalysisResult(
-                run_id=run.id,
-                file_path=result_data.get("file_path", ""),
-                line_number=result_data.get("line_number", 0),
-                issue_code=result_data.get("issue_code", ""),
-                issue_name=result_data.get("issue_name", result_data.get("issue_code", "")),
-                category=category_value,
-                severity=result_data.get("severity", "warning"),
-                message=result_data.get("message", ""),
-                suggestion=result_data.get("suggestion"),
-                before_code=result_data.get("before_code"),
-                after_code=result_data.get("after_code"),
-                is_fixed=result_data.get("is_fixed", 0),
+            results = run_agi_engineer_analysis(
+                repo_path=repo_path,
+                branch=branch,
+                commit_sha=commit_sha,
             )
-            db.add(issue)
-            total_issues += 1
+
+        mappings = build_result_mappings(run.id, results)
+        insert_results(db, mappings)
+        total_issues = len(mappings)
 
         run.status = RunStatus.COMPLETED
         run.completed_at = datetime.utcnow()
@@ -147,15 +156,18 @@ async def import_repository(
         github_repo_id = None
         try:
             headers = {"Authorization": f"Bearer {installation.access_token}", "Accept": "application/vnd.github+json"}
-            resp = requests.get(f"https://api.github.com/repos/{full_name}", headers=headers, timeout=10)
+            resp = _gh_session.get(f"https://api.github.com/repos/{full_name}", headers=headers, timeout=10)
             if resp.status_code == 200:
                 github_repo_id = resp.json().get("id")
         except Exception:
             github_repo_id = None
 
-        # Fallback pseudo id if GitHub call fails (demo mode)
+        # Fallback pseudo id if GitHub call fails (demo mode); must be stable
+        # across processes, which the seed-randomized builtin hash() is not
         if github_repo_id is None:
-            github_repo_id = abs(hash(full_name)) % (2**31)
+            github_repo_id = int.from_bytes(
+                hashlib.blake2b(full_name.encode(), digest_size=4).digest(), "big"
+            ) & 0x7FFFFFFF
 
         repo_name = full_name.split("/")[-1]
         repo = Repository(
@@ -1,7 +1,9 @@
 """Team collaboration API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 
 from app.db import get_db
@@ -27,7 +29,7 @@ class TeamInvite(BaseModel):
 
 
 @router.post("")
-async def create_team(
+def create_team(
     team_data: TeamCreate,
     token: str = Depends(verify_token),
     user: dict = Depends(get_current_user),
@@ -44,9 +46,11 @@ async def create_team(
     Returns:
         Created team details
     """
-    # Check if slug is unique
-    existing = db.query(Team).filter(Team.slug == team_data.slug).first()
-    if existing:
+    # Check if slug is unique (id-only probe served by the unique slug index)
+    slug_taken = db.execute(
+        select(Team.id).where(Team.slug == team_data.slug).limit(1)
+    ).first()
+    if slug_taken:
         raise HTTPException(status_code=400, detail="Team slug already exists")
     
     # Create team
@@ -58,14 +62,19 @@ async def create_team(
     )
     
     db.add(team)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent create for the same slug
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Team slug already exists")
     db.refresh(team)
     
     return team.to_dict()
 
 
 @router.get("/{team_id}")
-async def get_team(
+def get_team(
     team_id: int,
     token: str = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -80,7 +89,9 @@ async def get_team(
     Returns:
         Team details
     """
-    team = db.query(Team).filter(Team.id == team_id).first()
+    team = db.query(Team).options(
+        selectinload(Team.members)
+    ).filter(Team.id == team_id).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
@@ -92,7 +103,7 @@ async def get_team(
 
 
 @router.get("/{team_id}/activity")
-async def get_team_activity(
+def get_team_activity(
     team_id: int,
     limit: int = 50,
     token: str = Depends(verify_token),
@@ -109,21 +120,23 @@ async def get_team_activity(
     Returns:
         Activity log
     """
-    activities = db.query(ActivityLog).filter(
-        ActivityLog.team_id == team_id
-    ).order_by(
-        ActivityLog.created_at.desc()
-    ).limit(limit).all()
+    # COUNT(*) OVER () carries the full total alongside the page in one query
+    rows = db.execute(
+        select(ActivityLog, func.count().over().label("total"))
+        .where(ActivityLog.team_id == team_id)
+        .order_by(ActivityLog.created_at.desc())
+        .limit(limit)
+    ).all()
     
     return {
         "team_id": team_id,
-        "activities": [a.to_dict() for a in activities],
-        "total": len(activities)
+        "activities": [activity.to_dict() for activity, _ in rows],
+        "total": rows[0].total if rows else 0
     }
 
 
 @router.post("/{team_id}/members")
-async def invite_to_team(
+def invite_to_team(
     team_id: int,
     invite_data: TeamInvite,
     token: str = Depends(verify_token),
@@ -157,7 +170,7 @@ async def invite_to_team(
 
 
 @router.get("")
-async def list_user_teams(
+def list_user_teams(
     token: str = Depends(verify_token),
     user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1,18 +1,193 @@
 """GitHub webhook event handlers."""
 
 from fastapi import APIRouter, Request, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Integer, String, delete, exists, insert, literal, select
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+import logging
+import redis
 from app.db import get_db
 from app.models.repository import Repository
 from app.models.analysis_run import AnalysisRun, RunStatus
-from app.security import validate_webhook_signature
+from app.security import new_webhook_hmac, webhook_digest_matches
 from app.config import settings
-from app.tasks import run_code_analysis
-import json
+from app.tasks import enqueue_analysis
+import orjson
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
+# Repeat deliveries for the same commit inside this window reuse the first run
+DEDUP_WINDOW = timedelta(seconds=60)
+DEDUP_KEY_PREFIX = "run:dedup:"
+
+# Lazily connected so importing the router never touches Redis
+_dedup_client: Optional[redis.Redis] = None
+
+
+def _get_dedup_client() -> redis.Redis:
+    global _dedup_client
+    if _dedup_client is None:
+        _dedup_client = redis.Redis.from_url(settings.redis_url)
+    return _dedup_client
+
+
+def _dedup_key(github_repo_id: int, github_event: str, commit_sha: str) -> str:
+    return f"{DEDUP_KEY_PREFIX}{github_repo_id}:{github_event}:{commit_sha}"
+
+
+def _claim_delivery(key: str) -> bool:
+    """Atomically claim a delivery for the dedup window; False if already claimed.
+    
+    The database check alone is a NOT EXISTS at READ COMMITTED, which two
+    simultaneous deliveries can both pass. If Redis is unreachable the claim
+    succeeds and the database check is the only guard.
+    """
+    try:
+        return bool(_get_dedup_client().set(key, 1, nx=True, ex=int(DEDUP_WINDOW.total_seconds())))
+    except redis.RedisError as e:
+        logger.warning(f"Webhook dedup gate unavailable: {e}")
+        return True
+
+
+def _release_delivery(key: str) -> None:
+    """Drop a claim so a redelivery of the same event is processed."""
+    try:
+        _get_dedup_client().delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to release webhook dedup key {key}: {e}")
+
+
+def _find_recent_run(db: Session, github_repo_id: int, github_event: str, commit_sha: str) -> Optional[int]:
+    """Return the ID of a run already queued for this commit within the dedup window."""
+    return db.execute(
+        select(AnalysisRun.id)
+        .join(Repository, Repository.id == AnalysisRun.repository_id)
+        .where(
+            Repository.github_repo_id == github_repo_id,
+            AnalysisRun.github_event == github_event,
+            AnalysisRun.github_commit_sha == commit_sha,
+            AnalysisRun.created_at >= datetime.utcnow() - DEDUP_WINDOW,
+        )
+        .order_by(AnalysisRun.id.desc())
+        .limit(1)
+    ).scalar()
+
+
+def _create_run(
+    db: Session,
+    github_repo_id: int,
+    github_event: str,
+    branch: str,
+    commit_sha: str,
+    pr_number: Optional[int] = None,
+) -> Optional[Tuple[Optional[int], bool]]:
+    """Insert a pending run for an enabled repository in a single statement.
+    
+    A Redis ``SET NX`` claim admits one delivery per commit and event into
+    the dedup window. The repository lookup, enabled check and database
+    dedup check are all part of the ``INSERT ... SELECT`` so the common path
+    is one round trip.
+    
+    Args:
+        db: Database session
+        github_repo_id: GitHub's repository ID from the payload
+        github_event: Event name stored on the run
+        branch: Branch being analyzed
+        commit_sha: Commit being analyzed
+        pr_number: Pull request number, if any
+        
+    Returns:
+        ``(run_id, deduped)``, or None if the repository is untracked or
+        disabled. ``run_id`` is None for a duplicate whose original delivery
+        has not committed its run yet.
+    """
+    dedup_key = _dedup_key(github_repo_id, github_event, commit_sha)
+    if not _claim_delivery(dedup_key):
+        return _find_recent_run(db, github_repo_id, github_event, commit_sha), True
+
+    recent_run = exists().where(
+        AnalysisRun.repository_id == Repository.id,
+        AnalysisRun.github_event == github_event,
+        AnalysisRun.github_commit_sha == commit_sha,
+        AnalysisRun.created_at >= datetime.utcnow() - DEDUP_WINDOW,
+    )
+    source = select(
+        Repository.id,
+        literal(github_event, String),
+        literal(branch, String),
+        literal(commit_sha, String),
+        literal(pr_number, Integer),
+        literal(RunStatus.PENDING, AnalysisRun.__table__.c.status.type),
+    ).where(
+        Repository.github_repo_id == github_repo_id,
+        Repository.is_enabled.is_(True),
+        ~recent_run,
+    )
+    stmt = insert(AnalysisRun).from_select(
+        [
+            "repository_id",
+            "github_event",
+            "github_branch",
+            "github_commit_sha",
+            "pull_request_number",
+            "status",
+        ],
+        source,
+    ).returning(AnalysisRun.id)
+
+    run_id = db.execute(stmt).scalar()
+    if run_id is not None:
+        db.commit()
+        return run_id, False
+
+    # Nothing inserted: either a duplicate delivery or an untracked repository
+    db.rollback()
+    existing_run_id = _find_recent_run(db, github_repo_id, github_event, commit_sha)
+    if existing_run_id is not None:
+        return existing_run_id, True
+    _release_delivery(dedup_key)
+    return None
+
+
+def _enqueue_or_discard(db: Session, run_id: int, dedup_key: str) -> None:
+    """Queue analysis for a new run, deleting the run if the publish fails.
+    
+    Handlers run in the threadpool, so the synchronous broker publish never
+    blocks the event loop. On failure the pending run and its dedup claim are
+    removed before the error propagates, so GitHub's redelivery is not
+    swallowed by the dedup window.
+    
+    Args:
+        db: Database session
+        run_id: ID of the run that was just created
+        dedup_key: Claim taken for the delivery in ``_create_run``
+    """
+    try:
+        enqueue_analysis(run_id)
+    except Exception:
+        db.rollback()
+        db.execute(delete(AnalysisRun).where(AnalysisRun.id == run_id))
+        db.commit()
+        _release_delivery(dedup_key)
+        raise
+
+
+def _repo_fields(payload: dict) -> Tuple[Optional[str], Optional[int]]:
+    """Extract ``(full_name, id)`` of the repository from a webhook payload."""
+    repo = payload.get("repository") or {}
+    return repo.get("full_name"), repo.get("id")
+
+
+def _pr_fields(payload: dict) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """Extract ``(number, head ref, head sha)`` of the pull request from a webhook payload."""
+    pr = payload.get("pull_request") or {}
+    head = pr.get("head") or {}
+    return pr.get("number"), head.get("ref"), head.get("sha")
+
 
 @router.post("/github")
 async def github_webhook(
@@ -41,83 +216,75 @@ async def github_webhook(
     if not signature:
         raise HTTPException(status_code=401, detail="Missing signature")
 
-    body = await request.body()
-    if not validate_webhook_signature(body, signature):
+    # Hash the body as it arrives instead of after materializing it
+    body = bytearray()
+    h = new_webhook_hmac()
+    async for chunk in request.stream():
+        h.update(chunk)
+        body.extend(chunk)
+    if not webhook_digest_matches(h, signature):
         raise HTTPException(status_code=401, detail="Invalid signature")
 
     # Parse payload
-    payload = json.loads(body)
+    payload = orjson.loads(body)
     event_type = request.headers.get("X-GitHub-Event")
     action = payload.get("action")
 
-    try:
-        if event_type == "push":
-            return await handle_push_event(payload, db)
-        elif event_type == "pull_request":
-            return await handle_pull_request_event(payload, action, db)
-        elif event_type == "pull_request_review":
-            return await handle_review_event(payload, db)
-        else:
-            return {"status": "ignored", "event": event_type}
+    handler = _HANDLERS.get(event_type)
+    if handler is None:
+        return {"status": "ignored", "event": event_type}
 
+    # Handlers do blocking DB and broker I/O, so keep them off the event loop
+    try:
+        return await run_in_threadpool(handler, payload, action, db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Webhook processing failed: {str(e)}")
 
 
-async def handle_push_event(payload: dict, db: Session) -> dict:
+def handle_push_event(payload: dict, action: Optional[str], db: Session) -> dict:
     """Handle push event - trigger analysis on code push.
     
     Args:
         payload: GitHub push event payload
+        action: Unused; push events carry no action
         db: Database session
         
     Returns:
         Processing status
     """
-    repo_full_name = payload.get("repository", {}).get("full_name")
-    repo_id = payload.get("repository", {}).get("id")
+    repo_full_name, repo_id = _repo_fields(payload)
     ref = payload.get("ref", "").split("/")[-1]  # Get branch name
     commit_sha = payload.get("after")
 
     if not all([repo_full_name, commit_sha]):
         return {"status": "skipped", "reason": "Missing required fields"}
 
-    # Find repository
-    repository = db.query(Repository).filter(
-        Repository.github_repo_id == repo_id
-    ).first()
-
-    if not repository:
-        return {"status": "skipped", "reason": "Repository not tracked"}
-
-    if not repository.is_enabled:
-        return {"status": "skipped", "reason": "Repository analysis disabled"}
+    created = _create_run(db, repo_id, "push", ref, commit_sha)
+    if created is None:
+        return {"status": "skipped", "reason": "Repository not tracked or disabled"}
 
-    # Create analysis run
-    run = AnalysisRun(
-        repository_id=repository.id,
-        github_event="push",
-        github_branch=ref,
-        github_commit_sha=commit_sha,
-        status=RunStatus.PENDING,
-    )
-    db.add(run)
-    db.commit()
-    db.refresh(run)
+    run_id, deduped = created
+    if deduped:
+        return {
+            "status": "deduped",
+            "event": "push",
+            "repository": repo_full_name,
+            "run_id": run_id,
+        }
 
     # Queue background task for analysis
-    run_code_analysis.delay(run.id)
+    _enqueue_or_discard(db, run_id, _dedup_key(repo_id, "push", commit_sha))
 
     return {
         "status": "queued",
         "event": "push",
         "repository": repo_full_name,
         "branch": ref,
-        "run_id": run.id,
+        "run_id": run_id,
     }
 
 
-async def handle_pull_request_event(payload: dict, action: str, db: Session) -> dict:
+def handle_pull_request_event(payload: dict, action: str, db: Session) -> dict:
     """Handle pull request event.
     
     Args:
@@ -132,38 +299,28 @@ async def handle_pull_request_event(payload: dict, action: str, db: Session) ->
     if action not in ["opened", "synchronize", "reopened"]:
         return {"status": "ignored", "reason": f"Action '{action}' not configured"}
 
-    repo_full_name = payload.get("repository", {}).get("full_name")
-    repo_id = payload.get("repository", {}).get("id")
-    pr_number = payload.get("pull_request", {}).get("number")
-    branch = payload.get("pull_request", {}).get("head", {}).get("ref")
-    commit_sha = payload.get("pull_request", {}).get("head", {}).get("sha")
+    repo_full_name, repo_id = _repo_fields(payload)
+    pr_number, branch, commit_sha = _pr_fields(payload)
 
     if not all([repo_full_name, pr_number, commit_sha]):
         return {"status": "skipped", "reason": "Missing required fields"}
 
-    # Find repository
-    repository = db.query(Repository).filter(
-        Repository.github_repo_id == repo_id
-    ).first()
-
-    if not repository or not repository.is_enabled:
+    created = _create_run(db, repo_id, "pull_request", branch, commit_sha, pr_number)
+    if created is None:
         return {"status": "skipped", "reason": "Repository not tracked or disabled"}
 
-    # Create analysis run
-    run = AnalysisRun(
-        repository_id=repository.id,
-        github_event="pull_request",
-        github_branch=branch,
-        github_commit_sha=commit_sha,
-        pull_request_number=pr_number,
-        status=RunStatus.PENDING,
-    )
-    db.add(run)
-    db.commit()
-    db.refresh(run)
+    run_id, deduped = created
+    if deduped:
+        return {
+            "status": "deduped",
+            "event": "pull_request",
+            "repository": repo_full_name,
+            "pr": pr_number,
+            "run_id": run_id,
+        }
 
     # Queue background task for analysis
-    run_code_analysis.delay(run.id)
+    _enqueue_or_discard(db, run_id, _dedup_key(repo_id, "pull_request", commit_sha))
 
     return {
         "status": "queued",
@@ -171,58 +328,47 @@ async def handle_pull_request_event(payload: dict, action: str, db: Session) ->
         "action": action,
         "repository": repo_full_name,
         "pr": pr_number,
-        "run_id": run.id,
+        "run_id": run_id,
     }
 
 
-async def handle_review_event(payload: dict, db: Session) -> dict:
+def handle_review_event(payload: dict, action: Optional[str], db: Session) -> dict:
     """Handle pull request review event.
     
     Args:
         payload: GitHub review event payload
+        action: Review action (submitted, etc.)
         db: Database session
         
     Returns:
         Processing status
     """
-    action = payload.get("action")
-
     # Only trigger on review request
     if action not in ["requested_reviewer", "submitted"]:
         return {"status": "ignored", "reason": f"Action '{action}' not configured"}
 
-    repo_full_name = payload.get("repository", {}).get("full_name")
-    repo_id = payload.get("repository", {}).get("id")
-    pr_number = payload.get("pull_request", {}).get("number")
-    branch = payload.get("pull_request", {}).get("head", {}).get("ref")
-    commit_sha = payload.get("pull_request", {}).get("head", {}).get("sha")
+    repo_full_name, repo_id = _repo_fields(payload)
+    pr_number, branch, commit_sha = _pr_fields(payload)
 
     if not all([repo_full_name, pr_number, commit_sha]):
         return {"status": "skipped", "reason": "Missing required fields"}
 
-    # Find repository
-    repository = db.query(Repository).filter(
-        Repository.github_repo_id == repo_id
-    ).first()
-
-    if not repository or not repository.is_enabled:
+    created = _create_run(db, repo_id, "pull_request_review", branch, commit_sha, pr_number)
+    if created is None:
         return {"status": "skipped", "reason": "Repository not tracked or disabled"}
 
-    # Create analysis run
-    run = AnalysisRun(
-        repository_id=repository.id,
-        github_event="pull_request_review",
-        github_branch=branch,
-        github_commit_sha=commit_sha,
-        pull_request_number=pr_number,
-        status=RunStatus.PENDING,
-    )
-    db.add(run)
-    db.commit()
-    db.refresh(run)
+    run_id, deduped = created
+    if deduped:
+        return {
+            "status": "deduped",
+            "event": "pull_request_review",
+            "repository": repo_full_name,
+            "pr": pr_number,
+            "run_id": run_id,
+        }
 
     # Queue background task for analysis
-    run_code_analysis.delay(run.id)
+    _enqueue_or_discard(db, run_id, _dedup_key(repo_id, "pull_request_review", commit_sha))
 
     return {
         "status": "queued",
@@ -230,5 +376,13 @@ async def handle_review_event(payload: dict, db: Session) -> dict:
         "action": action,
         "repository": repo_full_name,
         "pr": pr_number,
-        "run_id": run.id,
+        "run_id": run_id,
     }
+
+
+# X-GitHub-Event -> handler; every handler takes (payload, action, db)
+_HANDLERS = {
+    "push": handle_push_event,
+    "pull_request": handle_pull_request_event,
+    "pull_request_review": handle_review_event,
+}
@@ -1,20 +1,69 @@
 """WebSocket connections for real-time updates."""
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Set
-import json
+from typing import Dict, Iterator, List, Optional
+import asyncio
+import logging
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Redis Pub/Sub channels; every API worker relays them to its own sockets
+RUN_CHANNEL_PREFIX = "ws:run:"
+DASHBOARD_CHANNEL_PREFIX = "ws:dash:"
+
+# A client that cannot take a frame within this many seconds is dropped
+SEND_TIMEOUT = 2.0
+
+class ConnectionGroup:
+    """Connections subscribed to one run or one user's dashboard.
+    
+    Backed by a list so broadcasts iterate contiguous memory. Removal leaves
+    a ``None`` slot; the list is compacted once over a quarter of it is dead.
+    """
+    
+    __slots__ = ("_slots", "_dead")
+    
+    def __init__(self):
+        self._slots: List[Optional[WebSocket]] = []
+        self._dead = 0
+
+    def add(self, websocket: WebSocket):
+        self._slots.append(websocket)
+
+    def discard(self, websocket: WebSocket):
+        for i, conn in enumerate(self._slots):
+            if conn is websocket:
+                self._slots[i] = None
+                self._dead += 1
+                if self._dead > len(self._slots) // 4:
+                    self._slots = [c for c in self._slots if c is not None]
+                    self._dead = 0
+                return
+
+    def __iter__(self) -> Iterator[WebSocket]:
+        return (c for c in self._slots if c is not None)
+
+    def __len__(self) -> int:
+        return len(self._slots) - self._dead
+
+
 # Active WebSocket connections
 class ConnectionManager:
     """Manage WebSocket connections for real-time updates."""
     
     def __init__(self):
-        # Map of run_id -> set of websocket connections
-        self.active_connections: Dict[int, Set[WebSocket]] = {}
-        # Map of user_id -> set of websocket connections for dashboard
-        self.dashboard_connections: Dict[int, Set[WebSocket]] = {}
+        # Map of run_id -> websocket connections
+        self.active_connections: Dict[int, ConnectionGroup] = {}
+        # Map of user_id -> websocket connections for dashboard
+        self.dashboard_connections: Dict[int, ConnectionGroup] = {}
 
     async def connect(self, websocket: WebSocket, run_id: int = None, user_id: int = None):
         """Accept new WebSocket connection."""
@@ -22,12 +71,12 @@ class ConnectionManager:
         
         if run_id:
             if run_id not in self.active_connections:
-                self.active_connections[run_id] = set()
+                self.active_connections[run_id] = ConnectionGroup()
             self.active_connections[run_id].add(websocket)
         
         if user_id:
             if user_id not in self.dashboard_connections:
-                self.dashboard_connections[user_id] = set()
+                self.dashboard_connections[user_id] = ConnectionGroup()
             self.dashboard_connections[user_id].add(websocket)
 
     def disconnect(self, websocket: WebSocket, run_id: int = None, user_id: int = None):
@@ -42,37 +91,100 @@ class ConnectionManager:
             if not self.dashboard_connections[user_id]:
                 del self.dashboard_connections[user_id]
 
+    async def _broadcast(self, connections: Dict[int, ConnectionGroup], key: int, message: dict):
+        """Send to every connection under ``key`` concurrently, dropping failures."""
+        targets = list(connections.get(key, ()))
+        if not targets:
+            return
+
+        # Serialize once for every recipient; text frames keep the send_json contract
+        frame = orjson.dumps(message).decode()
+
+        async def _send(connection: WebSocket) -> Optional[WebSocket]:
+            try:
+                await asyncio.wait_for(connection.send_text(frame), timeout=SEND_TIMEOUT)
+                return None
+            except Exception:
+                return connection
+
+        results = await asyncio.gather(*(_send(c) for c in targets))
+
+        # Clean up disconnected clients
+        remaining = connections.get(key)
+        if remaining is not None:
+            for conn in results:
+                if conn is not None:
+                    remaining.discard(conn)
+
     async def send_run_update(self, run_id: int, message: dict):
         """Broadcast run status update to all connected clients."""
-        if run_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[run_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.add(connection)
-            
-            # Clean up disconnected clients
-            for conn in disconnected:
-                self.active_connections[run_id].discard(conn)
+        await self._broadcast(self.active_connections, run_id, message)
 
     async def send_dashboard_update(self, user_id: int, message: dict):
         """Broadcast dashboard update to user's connections."""
-        if user_id in self.dashboard_connections:
-            disconnected = set()
-            for connection in self.dashboard_connections[user_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.add(connection)
-            
-            # Clean up disconnected clients
-            for conn in disconnected:
-                self.dashboard_connections[user_id].discard(conn)
+        await self._broadcast(self.dashboard_connections, user_id, message)
 
 
 manager = ConnectionManager()
 
+_publisher: Optional[redis.Redis] = None
+
+
+def _get_publisher() -> redis.Redis:
+    global _publisher
+    if _publisher is None:
+        _publisher = redis.Redis.from_url(settings.redis_url)
+    return _publisher
+
+
+def publish_run_update(run_id: int, message: dict) -> None:
+    """Publish a run update to all API workers (callable from Celery tasks)."""
+    _get_publisher().publish(f"{RUN_CHANNEL_PREFIX}{run_id}", orjson.dumps(message))
+
+
+def publish_dashboard_update(user_id: int, message: dict) -> None:
+    """Publish a dashboard update to all API workers (callable from Celery tasks)."""
+    _get_publisher().publish(f"{DASHBOARD_CHANNEL_PREFIX}{user_id}", orjson.dumps(message))
+
+
+async def relay_message(channel: str, data: bytes) -> None:
+    """Deliver one Pub/Sub message to the sockets held by this worker."""
+    message = orjson.loads(data)
+    if channel.startswith(RUN_CHANNEL_PREFIX):
+        await manager.send_run_update(int(channel[len(RUN_CHANNEL_PREFIX):]), message)
+    elif channel.startswith(DASHBOARD_CHANNEL_PREFIX):
+        await manager.send_dashboard_update(int(channel[len(DASHBOARD_CHANNEL_PREFIX):]), message)
+
+
+async def pubsub_listener(retry_delay: float = 5.0) -> None:
+    """Subscribe once per worker and relay updates until cancelled.
+
+    Reconnects after ``retry_delay`` seconds if Redis is unavailable.
+    """
+    while True:
+        client = aioredis.Redis.from_url(settings.redis_url)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.psubscribe(f"{RUN_CHANNEL_PREFIX}*", f"{DASHBOARD_CHANNEL_PREFIX}*")
+            async for msg in pubsub.listen():
+                if msg["type"] != "pmessage":
+                    continue
+                channel = msg["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                try:
+                    await relay_message(channel, msg["data"])
+                except Exception:
+                    logger.exception(f"Failed to relay WebSocket update on {channel}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"WebSocket Pub/Sub unavailable ({e}); retrying in {retry_delay}s")
+            await asyncio.sleep(retry_delay)
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
 
 @router.websocket("/ws/run/{run_id}")
 async def websocket_run_status(websocket: WebSocket, run_id: int):
@@ -87,7 +199,7 @@ async def websocket_run_status(websocket: WebSocket, run_id: int):
             # Keep connection alive and listen for client messages
             data = await websocket.receive_text()
             # Echo back for heartbeat
-            await websocket.send_json({"type": "pong", "run_id": run_id})
+            await websocket.send_text(orjson.dumps({"type": "pong", "run_id": run_id}).decode())
     except WebSocketDisconnect:
         manager.disconnect(websocket, run_id=run_id)
 
@@ -104,6 +216,6 @@ async def websocket_dashboard(websocket: WebSocket, user_id: int):
         while True:
             # Keep connection alive
             data = await websocket.receive_text()
-            await websocket.send_json({"type": "pong"})
+            await websocket.send_text('{"type":"pong"}')
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id=user_id)
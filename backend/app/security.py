@@ -1,29 +1,47 @@
 """GitHub OAuth utilities and JWT handling."""
 import jwt
-import requests
-import hmac
-import hashlib
+import httpx
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from urllib.parse import quote, urlencode
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, hmac as chmac
 from fastapi import HTTPException, Request, Header
 from app.config import settings
+# Shared keep-alive pool for GitHub OAuth calls; created lazily on the running loop.
+_http_client: Optional[httpx.AsyncClient] = None
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+        )
+    return _http_client
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 class GitHubOAuthManager:
     GITHUB_AUTH_URL = "https://github.com/login/oauth/authorize"
     GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
     GITHUB_USER_URL = "https://api.github.com/user"
+    # Only state varies per request; the rest of the query string is static.
+    _AUTH_URL_PREFIX = GITHUB_AUTH_URL + "?" + urlencode({
+        "client_id": settings.github_client_id,
+        "redirect_uri": f"{settings.frontend_url}/oauth/callback",
+        "scope": "repo admin:repo_hook read:org",
+    })
     @staticmethod
     def get_authorization_url(state: str) -> str:
-        params = {
-            "client_id": settings.github_client_id,
-            "redirect_uri": f"{settings.frontend_url}/oauth/callback",
-            "scope": "repo admin:repo_hook read:org",
-            "state": state,
-        }
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{GitHubOAuthManager.GITHUB_AUTH_URL}?{query_string}"
+        return f"{GitHubOAuthManager._AUTH_URL_PREFIX}&state={quote(state, safe='')}"
     @staticmethod
-    def exchange_code_for_token(code: str) -> Dict[str, Any]:
+    async def exchange_code_for_token(code: str) -> Dict[str, Any]:
         payload = {
             "client_id": settings.github_client_id,
             "client_secret": settings.github_client_secret,
@@ -32,7 +50,7 @@ class GitHubOAuthManager:
         }
         headers = {"Accept": "application/json"}
         logging.error(f"OAuth exchange: client_id={settings.github_client_id}, redirect_uri={settings.frontend_url}/oauth/callback")
-        response = requests.post(GitHubOAuthManager.GITHUB_TOKEN_URL, json=payload, headers=headers)
+        response = await _get_http_client().post(GitHubOAuthManager.GITHUB_TOKEN_URL, json=payload, headers=headers)
         logging.error(f"GitHub response: {response.status_code} - {response.text}")
         if response.status_code != 200:
             raise ValueError(f"Failed to exchange code: {response.text}")
@@ -41,14 +59,21 @@ class GitHubOAuthManager:
             raise ValueError(f"GitHub OAuth error: {data.get('error_description', data.get('error'))}")
         return data
     @staticmethod
-    def get_user_info(access_token: str) -> Dict[str, Any]:
+    async def get_user_info(access_token: str) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/vnd.github.v3+json",
         }
-        response = requests.get(GitHubOAuthManager.GITHUB_USER_URL, headers=headers)
+        response = await _get_http_client().get(GitHubOAuthManager.GITHUB_USER_URL, headers=headers)
         response.raise_for_status()
         return response.json()
+# Process-local cache of verified tokens; never shared across processes.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL = 30.0
+_TOKEN_EXPIRY_MARGIN = 5.0  # stop serving cached claims this close to exp
+_token_cache: "OrderedDict[str, tuple[Dict[str, Any], float, int]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+_token_generation = 0
 class JWTManager:
     @staticmethod
     def create_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -58,14 +83,49 @@ class JWTManager:
         return jwt.encode(to_encode, settings.jwt_secret_key, algorithm="HS256")
     @staticmethod
     def verify_token(token: str) -> Dict[str, Any]:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        now = time.time()
+        with _token_cache_lock:
+            entry = _token_cache.get(token)
+            if entry is not None:
+                claims, expires_at, generation = entry
+                if generation == _token_generation and expires_at > now:
+                    _token_cache.move_to_end(token)
+                    return dict(claims)
+                del _token_cache[token]
+            generation = _token_generation
+        claims = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        expires_at = min(now + _TOKEN_CACHE_TTL, claims.get("exp", float("inf")) - _TOKEN_EXPIRY_MARGIN)
+        with _token_cache_lock:
+            if generation == _token_generation:
+                _token_cache[token] = (claims, expires_at, generation)
+                if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+                    _token_cache.popitem(last=False)
+        return dict(claims)
+    @staticmethod
+    def invalidate_cache() -> None:
+        global _token_generation
+        with _token_cache_lock:
+            _token_generation += 1
+            _token_cache.clear()
+# The webhook secret is fixed for the process, so derive the keyed HMAC state once.
+_WEBHOOK_SECRET_BYTES = settings.webhook_secret.encode()
+_WEBHOOK_HMAC_TEMPLATE = chmac.HMAC(_WEBHOOK_SECRET_BYTES, hashes.SHA256())
+def new_webhook_hmac() -> chmac.HMAC:
+    # Fresh keyed HMAC (OpenSSL-backed) for feeding a webhook body in chunks.
+    return _WEBHOOK_HMAC_TEMPLATE.copy()
+def webhook_digest_matches(h: chmac.HMAC, signature: str) -> bool:
+    # Verify the raw 32-byte digest; HMAC.verify is constant-time.
+    if not signature.startswith("sha256="):
+        return False
+    try:
+        h.verify(bytes.fromhex(signature[7:]))
+    except (ValueError, InvalidSignature):
+        return False
+    return True
 def validate_webhook_signature(payload: bytes, signature: str) -> bool:
-    expected_signature = "sha256=" + hmac.new(
-        settings.webhook_secret.encode(),
-        payload,
-        hashlib.sha256,
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected_signature)
+    h = new_webhook_hmac()
+    h.update(payload)
+    return webhook_digest_matches(h, signature)
 def verify_token(token: str | None = None, authorization: str = Header(None)):
     extracted = token
     if not extracted and authorization and authorization.startswith("Bearer "):
@@ -17,6 +17,7 @@ Design Principles:
 - Human approval required
 """
 import logging
+import os
 import uuid
 import hashlib
 from datetime import datetime
@@ -422,7 +423,20 @@ class BatchFixService:
             
             # 3. Apply each fix
             results = {"applied": [], "failed": []}
+            file_paths = {f["id"]: f.get("file_path") for f in validation["fixes"]}
+            missing_files = set()
             for fix_id in fix_ids:
+                # A missing file fails every remaining fix that targets it;
+                # skip those without another load/validate round-trip
+                file_path = file_paths.get(fix_id)
+                if file_path in missing_files:
+                    results["failed"].append({
+                        "fix_id": fix_id,
+                        "error": "validation_failed",
+                        "message": f"File does not exist: {file_path}"
+                    })
+                    continue
+                
                 result = self.application_service.apply_fix(
                     fix_id=fix_id,
                     applied_by=user_id,
@@ -442,6 +456,8 @@ class BatchFixService:
                         "error": result.get("error"),
                         "message": result.get("message")
                     })
+                    if file_path and not os.path.exists(file_path):
+                        missing_files.add(file_path)
             
             # 4. Generate combined patch hash
             combined_patch = self.generate_combined_patch([r["fix_id"] for r in results["applied"]])
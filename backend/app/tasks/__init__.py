@@ -4,4 +4,16 @@ from .celery_app import celery_app
 from .analysis_tasks import run_code_analysis
 from .fix_tasks import generate_code_fix, create_github_pr
 
-__all__ = ["celery_app", "run_code_analysis", "generate_code_fix", "create_github_pr"]
+
+def enqueue_analysis(run_id: int) -> None:
+    """Queue ``run_code_analysis`` for a run; raises if the broker publish fails."""
+    celery_app.send_task(run_code_analysis.name, args=[run_id])
+
+
+__all__ = [
+    "celery_app",
+    "run_code_analysis",
+    "generate_code_fix",
+    "create_github_pr",
+    "enqueue_analysis",
+]
@@ -1,8 +1,13 @@
 """Celery application configuration for background task processing."""
 
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_init
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Initialize Celery with Redis as broker and backend
 celery_app = Celery(
     "agi_engineer",
@@ -12,15 +17,45 @@ celery_app = Celery(
 )
 
 # Celery configuration
+# Workers should be started with -Ofair so a child busy with a long analysis
+# is never handed queued tasks that idle children could run, and with
+# --autoscale=8,2 so bursts get extra children while idle workers shrink back.
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is smaller and faster to (de)serialize; json stays accepted so
+    # messages queued by not-yet-upgraded producers still run
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=3600,  # 1 hour max per task
     task_soft_time_limit=3300,  # 55 minutes soft limit
     worker_prefetch_multiplier=1,
-    worker_max_tasks_per_child=100,
+    task_acks_late=True,  # Ack after completion so a crashed worker's task is redelivered
+    task_reject_on_worker_lost=True,
+    # Redis redelivers unacked tasks after this; keep it above task_time_limit
+    broker_transport_options={"visibility_timeout": 7200},
+    # Recycling a child re-imports the analyzer and reconnects to the DB, so
+    # do it rarely; the memory cap (KB) still catches leaks
+    worker_max_tasks_per_child=1000,
+    worker_max_memory_per_child=512_000,
 )
+
+
+@worker_process_init.connect
+def warm_worker_process(**kwargs):
+    """Prepare a freshly forked child before it receives its first task.
+    
+    Task modules are imported by the parent before forking. Here the child
+    drops pooled DB connections inherited from the parent and opens its own.
+    """
+    from app.db import engine
+
+    engine.dispose(close=False)
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        logger.warning(f"Could not pre-connect worker to database: {e}")
@@ -1,11 +1,12 @@
 """Celery tasks for AI-powered code fixing."""
 
 from .celery_app import celery_app
-from app.db import SessionLocal
+from app.db import ScopedSession
 from app.models.analysis_result import AnalysisResult
 from app.models.code_fix import CodeFix, FixStatus
 from app.ai.code_fixer import get_ai_provider
 from datetime import datetime
+import asyncio
 
 
 @celery_app.task(name="app.tasks.generate_code_fix", bind=True)
@@ -19,7 +20,8 @@ def generate_code_fix(self, result_id: int, provider: str = "groq") -> dict:
     Returns:
         Fix generation result
     """
-    db = SessionLocal()
+    db = ScopedSession()
+    original_code = ""
     
     try:
         # Get result
@@ -27,28 +29,29 @@ def generate_code_fix(self, result_id: int, provider: str = "groq") -> dict:
         if not result:
             return {"error": f"Result {result_id} not found"}
         
-        # Get AI provider
-        ai = get_ai_provider(provider)
-        
-        # Prepare issue info
+        # Read the ORM attributes once; the error path reuses these locals
+        original_code = result.before_code or ""
         issue_info = {
-            "rule_id": result.rule_id,
-            "name": result.name or result.code,
+            "rule_id": result.issue_code,
+            "name": result.issue_name or result.issue_code,
             "message": result.message,
             "category": result.category,
             "severity": result.severity,
         }
         
-        # Generate fix
-        fixed_code = ai.generate_fix(issue_info, result.code_snippet or "")
+        # Get AI provider
+        ai = get_ai_provider(provider)
+        
+        # Generate fix (providers are async; this task runs in a sync worker)
+        fixed_code = asyncio.run(ai.generate_fix(issue_info, original_code))
         
         # Generate explanation
-        explanation = ai.generate_explanation(issue_info, fixed_code)
+        explanation = asyncio.run(ai.generate_explanation(issue_info, fixed_code))
         
         # Save to database
         code_fix = CodeFix(
             result_id=result_id,
-            original_code=result.code_snippet or "",
+            original_code=original_code,
             fixed_code=fixed_code,
             explanation=explanation,
             status=FixStatus.GENERATED,
@@ -71,9 +74,10 @@ def generate_code_fix(self, result_id: int, provider: str = "groq") -> dict:
         
         # Try to save error fix
         try:
+            db.rollback()
             code_fix = CodeFix(
                 result_id=result_id,
-                original_code=result.code_snippet or "",
+                original_code=original_code,
                 fixed_code="",
                 explanation=f"Error: {str(e)}",
                 status=FixStatus.FAILED,
@@ -87,7 +91,7 @@ def generate_code_fix(self, result_id: int, provider: str = "groq") -> dict:
         return {"status": "failed", "error": str(e)}
         
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 @celery_app.task(name="app.tasks.create_github_pr")
@@ -101,7 +105,7 @@ def create_github_pr(fix_id: int, branch_name: str = None) -> dict:
     Returns:
         PR creation result
     """
-    db = SessionLocal()
+    db = ScopedSession()
     
     try:
         # Get fix
@@ -139,7 +143,7 @@ def create_github_pr(fix_id: int, branch_name: str = None) -> dict:
         return {"status": "failed", "error": str(e)}
         
     finally:
-        db.close()
+        ScopedSession.remove()
 
 
 def create_bulk_github_pr(
@@ -3,47 +3,370 @@
 import subprocess
 import tempfile
 import shutil
-import json
+import hashlib
+import fcntl
+import os
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
 from app.models.analysis_result import AnalysisResult, IssueCategory
 import logging
+import orjson
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from agent.rule_classifier import RuleClassifier, RuleCategory
 
 logger = logging.getLogger(__name__)
 
+_CLASSIFIER = RuleClassifier()
+_SUGGESTION = IssueCategory.SUGGESTION.value
+_RULE_CATEGORIES = {
+    RuleCategory.SAFE: IssueCategory.SAFE.value,
+    RuleCategory.RISKY: IssueCategory.REVIEW.value,
+}
+_JS_CATEGORIES = {
+    "no-console": IssueCategory.SAFE.value,
+    "no-unused-vars": IssueCategory.SAFE.value,
+    "prefer-const": IssueCategory.SAFE.value,
+    "no-var": IssueCategory.SAFE.value,
+    "@typescript-eslint/no-unused-vars": IssueCategory.REVIEW.value,
+    "@typescript-eslint/no-explicit-any": IssueCategory.REVIEW.value,
+}
+
+
+@lru_cache(maxsize=4096)
+def _python_category(code: str) -> str:
+    """Map a Ruff code to an IssueCategory value, classifying each code once."""
+    return _RULE_CATEGORIES.get(_CLASSIFIER.classify(code).get("category"), _SUGGESTION)
+
+
+# Serialized once; written into the shared ESLint toolchain directory
+_ESLINT_CONFIG = orjson.dumps({
+    "env": {"browser": True, "es2021": True, "node": True},
+    "parser": "@typescript-eslint/parser",
+    "plugins": ["@typescript-eslint"],
+    "rules": {
+        "no-unused-vars": "warn",
+        "no-console": "warn",
+        "no-undef": "warn",
+        "prefer-const": "warn",
+        "no-var": "warn",
+        "@typescript-eslint/no-unused-vars": "warn",
+        "@typescript-eslint/no-explicit-any": "warn",
+    },
+})
+
+# Files a worktree needs for linting; everything else stays unfetched
+_LINT_SUFFIXES = (b".py", b".pyi", b".js", b".jsx", b".ts", b".tsx")
+_LINT_CONFIGS = frozenset({
+    b"pyproject.toml", b"ruff.toml", b".ruff.toml", b"setup.cfg",
+    b"package.json", b"tsconfig.json", b".eslintrc", b".eslintrc.js",
+    b".eslintrc.json", b".eslintrc.yml", b".eslintrc.yaml", b".eslintignore",
+    b"eslint.config.js", b"eslint.config.mjs",
+})
+
+class NormalizedIssue(NamedTuple):
+    """One linter finding; a tuple keeps large reports compact."""
+
+    file_path: str
+    line_number: int
+    issue_code: str
+    issue_name: str
+    category: str
+    severity: str
+    message: str
+    language: str
+
+
+# "path:line:col: CODE [*] message"; newer Ruff reports syntax errors as
+# "path:line:col: invalid-syntax: message" and older Ruff with no code at all.
+# The path may itself contain ":", so it ends at the first ":line:col: ".
+_RUFF_LINE_RE = re.compile(
+    rb"^(?P<file>.+?):(?P<line>\d+):\d+: "
+    rb"(?:(?P<code>[A-Z]+[0-9]+(?= )|[a-z]+(?:-[a-z]+)*(?=: )):? )?"
+    rb"(?:\[\*\] )?(?P<msg>.*?)\r?$"
+)
+
+
+@lru_cache(maxsize=None)
+def _ruff_line_format(ruff_bin: str) -> str:
+    """One-line-per-violation format name: ``concise`` on newer Ruff, ``text`` before it."""
+    usage = subprocess.run([ruff_bin, "check", "--help"], capture_output=True, timeout=30).stdout
+    return "concise" if b"concise" in usage else "text"
+
+
+# Completed analyses kept per engine, keyed by repository and commit
+RESULT_CACHE_SIZE = 256
+
+# Below this many Python files a single Ruff process is faster than sharding
+RUFF_SHARD_MIN_FILES = 200
+
+# Seconds a single Ruff process may run before it is killed
+RUFF_TIMEOUT = 120
+
+
+class RepoCache:
+    """Persistent shallow bare mirrors, one per repository URL.
+
+    Each analysis fetches just the commit it needs into the mirror (trees only;
+    blobs are fetched for lintable files when the worktree is populated) and
+    gets a disposable worktree, so repeat analyses of a repository only
+    transfer new objects. Mirrors unused for ``ttl`` seconds, or beyond ``max_entries``,
+    are evicted when a new mirror is created.
+    """
+
+    DEFAULT_ROOT = Path.home() / ".cache" / "agi-engineer" / "repos"
+
+    def __init__(self, root: Optional[Path] = None, max_entries: int = 50, ttl: float = 7 * 86400):
+        self.root = Path(root) if root else self.DEFAULT_ROOT
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def _mirror_path(self, repo_url: str) -> Path:
+        return self.root / f"{hashlib.sha256(repo_url.encode()).hexdigest()[:24]}.git"
+
+    @staticmethod
+    @contextmanager
+    def _locked(path: Path, mode: int = fcntl.LOCK_EX) -> Iterator[None]:
+        """Hold ``flock(mode)`` on ``path``; ``LOCK_NB`` modes raise BlockingIOError.
+
+        evict() unlinks lock files, so a lock won on an inode that is no
+        longer at ``path`` is dropped and taken again on the current file.
+        """
+        while True:
+            lock_file = open(path, "a")
+            try:
+                fcntl.flock(lock_file, mode)
+                held = os.fstat(lock_file.fileno()).st_ino
+                try:
+                    current = os.stat(path).st_ino
+                except FileNotFoundError:
+                    current = None
+            except BaseException:
+                lock_file.close()
+                raise
+            if held == current:
+                break
+            lock_file.close()
+        try:
+            yield
+        finally:
+            lock_file.close()  # releases the flock
+
+    @staticmethod
+    def _git(*args: str, timeout: int = 30) -> str:
+        result = subprocess.run(["git", *args], check=True, capture_output=True, text=True, timeout=timeout)
+        return result.stdout.strip()
+
+    @contextmanager
+    def worktree(self, repo_url: str, ref: str) -> Iterator[Path]:
+        """Yield a detached checkout of ``ref`` (commit SHA or branch); removed on exit."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        mirror = self._mirror_path(repo_url)
+        target = tempfile.mkdtemp(prefix="agi-analysis-")
+
+        # A shared lock on ``.lock`` marks the mirror in use for the whole
+        # worktree lifetime, so evict() in another process skips it; git
+        # operations on the mirror are serialized on ``.fetch.lock``.
+        with self._locked(mirror.with_suffix(".lock"), fcntl.LOCK_SH):
+            created = False
+            with self._locked(mirror.with_suffix(".fetch.lock")):
+                if not mirror.exists():
+                    self._git("init", "-q", "--bare", str(mirror))
+                    self._git("-C", str(mirror), "remote", "add", "origin", repo_url)
+                    # Partial clone: fetches bring commits and trees only, and blobs
+                    # are fetched on demand. Servers without filter support ignore it
+                    # and send a full pack.
+                    for key, value in (
+                        ("core.repositoryformatversion", "1"),
+                        ("extensions.partialClone", "origin"),
+                        ("remote.origin.promisor", "true"),
+                        ("remote.origin.partialclonefilter", "blob:none"),
+                    ):
+                        self._git("-C", str(mirror), "config", key, value)
+                    created = True
+                self._git(
+                    "-C", str(mirror), "-c", "protocol.version=2",
+                    "fetch", "--depth=1", "--no-tags", "origin", ref,
+                    timeout=60,
+                )
+                sha = self._git("-C", str(mirror), "rev-parse", "FETCH_HEAD")
+                self._git("-C", str(mirror), "worktree", "add", "-q", "--detach", "--force", "--no-checkout", target, sha)
+                self._checkout_lintable(target, sha)
+                os.utime(mirror)  # LRU stamp for eviction
+            if created:
+                self.evict(keep=mirror)
+
+            try:
+                yield Path(target)
+            finally:
+                with self._locked(mirror.with_suffix(".fetch.lock")):
+                    try:
+                        self._git("-C", str(mirror), "worktree", "remove", "--force", target)
+                    except subprocess.CalledProcessError:
+                        shutil.rmtree(target, ignore_errors=True)
+                        self._git("-C", str(mirror), "worktree", "prune")
+
+    @staticmethod
+    def _checkout_lintable(target: str, sha: str) -> None:
+        """Materialize only the files Ruff and ESLint read, in one blob fetch."""
+        listing = subprocess.run(
+            ["git", "-C", target, "ls-tree", "-r", "-z", "--name-only", sha],
+            check=True, capture_output=True, timeout=30,
+        ).stdout
+        paths = [
+            path for path in listing.split(b"\0")
+            if path.endswith(_LINT_SUFFIXES) or path.rsplit(b"/", 1)[-1] in _LINT_CONFIGS
+        ]
+        if paths:
+            subprocess.run(
+                ["git", "-C", target, "checkout", sha, "--pathspec-from-file=-", "--pathspec-file-nul"],
+                input=b"\0".join(paths), check=True, capture_output=True, timeout=120,
+            )
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Delete mirrors idle longer than ``ttl`` and the oldest beyond ``max_entries``.
+
+        Mirrors with a live worktree hold a shared lock and are skipped.
+        """
+        stamped = []
+        for mirror in self.root.glob("*.git"):
+            try:
+                if mirror != keep:
+                    stamped.append((mirror.stat().st_mtime, mirror))
+            except FileNotFoundError:  # evicted by another worker meanwhile
+                continue
+        stamped.sort(reverse=True)
+        cutoff = time.time() - self.ttl
+        for index, (mtime, mirror) in enumerate(stamped):
+            if index >= self.max_entries - 1 or mtime < cutoff:
+                try:
+                    with self._locked(mirror.with_suffix(".lock"), fcntl.LOCK_EX | fcntl.LOCK_NB):
+                        shutil.rmtree(mirror, ignore_errors=True)
+                        mirror.with_suffix(".fetch.lock").unlink(missing_ok=True)
+                        mirror.with_suffix(".lock").unlink(missing_ok=True)
+                except BlockingIOError:
+                    continue
+
+
+class ESLintToolchain:
+    """Shared ESLint install and config used by every V1 analysis.
+
+    ESLint and the TypeScript parser/plugin are installed once under ``root``
+    with ``npm install --prefix``, so checkouts never bootstrap their own
+    ``node_modules``. Falls back to an ``eslint`` on PATH when npm is missing
+    or the install fails.
+    """
+
+    DEFAULT_ROOT = Path.home() / ".cache" / "agi-engineer" / "eslint"
+    PACKAGES = ("eslint@8", "@typescript-eslint/parser@6", "@typescript-eslint/eslint-plugin@6")
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else self.DEFAULT_ROOT
+        self.config_path = self.root / "eslintrc.json"
+        self._lock = threading.Lock()
+        self._resolved = False
+        self._binary: Optional[str] = None
+
+    def binary(self) -> Optional[str]:
+        """Absolute path of the eslint to run, installing it on first use."""
+        with self._lock:
+            if not self._resolved:
+                self._binary = self._install()
+                self._resolved = True
+            return self._binary
+
+    def _install(self) -> Optional[str]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        local = self.root / "node_modules" / ".bin" / "eslint"
+        # flock serializes the install across worker processes
+        with open(self.root / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self.config_path.write_bytes(_ESLINT_CONFIG)
+            npm = shutil.which("npm")
+            if not local.exists() and npm:
+                try:
+                    subprocess.run(
+                        [npm, "install", "--prefix", str(self.root), "--no-audit", "--no-fund", *self.PACKAGES],
+                        check=True, capture_output=True, timeout=300,
+                    )
+                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                    logger.warning(f"Shared ESLint install failed: {e}")
+        if local.exists():
+            return str(local)
+        return shutil.which("eslint")
+
 
 class V1AnalysisEngine:
-    def __init__(self, groq_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        groq_api_key: Optional[str] = None,
+        repo_cache: Optional[RepoCache] = None,
+        eslint: Optional["ESLintToolchain"] = None,
+    ):
         self.groq_api_key = groq_api_key
-        self.temp_dirs: List[str] = []
+        self.repo_cache = repo_cache or _REPO_CACHE
+        self.eslint = eslint or _ESLINT_TOOLCHAIN
+        # Resolved once per engine; a missing linter is skipped, not retried
+        self._ruff_bin = shutil.which("ruff")
+        self._ruff_format = _ruff_line_format(self._ruff_bin) if self._ruff_bin else None
+        # (repo_url, commit_sha) -> completed result, least recently used first
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
-    def analyze_repository(self, repo_url: str, branch: str = "main", commit_sha: Optional[str] = None) -> Dict[str, Any]:
-        temp_dir = None
-        try:
-            temp_dir = tempfile.mkdtemp(prefix="agi-analysis-")
-            self.temp_dirs.append(temp_dir)
-            logger.info(f"Created temp directory: {temp_dir}")
+    def analyze_repository(
+        self,
+        repo_url: str,
+        branch: str = "main",
+        commit_sha: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        # A commit's findings never change, so re-runs of an analyzed SHA
+        # (PR re-runs, webhook retries) skip the checkout and linters
+        cache_key = (repo_url, commit_sha) if commit_sha else None
+        if cache_key and not force:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing analysis of {repo_url}@{commit_sha}")
+                return {
+                    **cached,
+                    "branch": branch,
+                    "issues": list(cached["issues"]),
+                    "analyzed_at": datetime.utcnow().isoformat(),
+                }
 
-            self._clone_repository(repo_url, temp_dir, branch)
-            logger.info(f"Cloned repository to {temp_dir}")
+        try:
+            with self.repo_cache.worktree(repo_url, commit_sha or branch) as worktree:
+                temp_dir = str(worktree)
+                logger.info(f"Checked out {repo_url}@{commit_sha or branch} to {temp_dir}")
 
-            if commit_sha:
-                self._checkout_commit(temp_dir, commit_sha)
+                # One walk decides which linters have anything to read; a
+                # linter with no matching files is never started
+                python_files, has_js = self._scan_tree(temp_dir)
 
-            ruff_results = self._run_ruff_analysis(temp_dir)
+                # Linters read disjoint file types from the same tree; run them side by side
+                with ThreadPoolExecutor(max_workers=2, thread_name_prefix="v1-lint") as pool:
+                    ruff_future = pool.submit(self._run_ruff_analysis, temp_dir, python_files) if python_files else None
+                    eslint_future = pool.submit(self._run_eslint_analysis, temp_dir) if has_js else None
+                    ruff_results = ruff_future.result() if ruff_future else []
+                    eslint_results = eslint_future.result() if eslint_future else []
             logger.info(f"Ruff analysis found {len(ruff_results)} issues")
-
-            eslint_results = self._run_eslint_analysis(temp_dir)
             logger.info(f"ESLint analysis found {len(eslint_results)} issues")
 
             all_issues = ruff_results + eslint_results
 
-            return {
+            result = {
                 "status": "completed",
                 "repository": repo_url,
                 "branch": branch,
@@ -54,6 +377,13 @@ class V1AnalysisEngine:
                 "eslint_count": len(eslint_results),
                 "analyzed_at": datetime.utcnow().isoformat(),
             }
+            if cache_key:
+                with self._result_cache_lock:
+                    self._result_cache[cache_key] = {**result, "issues": list(all_issues)}
+                    self._result_cache.move_to_end(cache_key)
+                    while len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            return result
 
         except Exception as e:
             logger.error(f"Analysis failed: {str(e)}", exc_info=True)
@@ -64,144 +394,159 @@ class V1AnalysisEngine:
                 "analyzed_at": datetime.utcnow().isoformat(),
             }
 
-        finally:
-            if temp_dir and Path(temp_dir).exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+    def _run_ruff_analysis(self, repo_dir: str, files: Optional[List[str]] = None) -> List[NormalizedIssue]:
+        if not self._ruff_bin:
+            logger.warning("Ruff not installed")
+            return []
+        if files is None:
+            files, _ = self._scan_tree(repo_dir)
+        shards = min(os.cpu_count() or 1, len(files) // RUFF_SHARD_MIN_FILES)
+        if shards < 2:
+            return self._run_ruff([repo_dir])
 
-    def _clone_repository(self, repo_url: str, target_dir: str, branch: str) -> None:
-        cmd = ["git", "clone", "--depth=1", "--branch", branch, repo_url, target_dir]
-        subprocess.run(cmd, check=True, capture_output=True, timeout=60)
+        # Large repositories are split round-robin across one single-threaded
+        # Ruff per core, capping the memory any one process holds.
+        # --force-exclude keeps Ruff's exclude settings for explicit paths and
+        # --no-cache stops the shards racing on the same cache directory.
+        env = {**os.environ, "RAYON_NUM_THREADS": "1"}
+        with ThreadPoolExecutor(max_workers=shards) as pool:
+            batches = pool.map(
+                lambda shard: self._run_ruff(shard, ["--force-exclude", "--no-cache"], env),
+                [files[i::shards] for i in range(shards)],
+            )
+            return [issue for batch in batches for issue in batch]
 
-    def _checkout_commit(self, repo_dir: str, commit_sha: str) -> None:
-        cmd = ["git", "-C", repo_dir, "checkout", commit_sha]
-        subprocess.run(cmd, check=True, capture_output=True, timeout=30)
+    @staticmethod
+    def _scan_tree(repo_dir: str) -> Tuple[List[str], bool]:
+        """Python files under ``repo_dir`` and whether any JS/TS file exists."""
+        files = []
+        has_js = False
+        for root, dirs, names in os.walk(repo_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "node_modules"]
+            for name in names:
+                if name.endswith((".py", ".pyi")):
+                    files.append(os.path.join(root, name))
+                elif not has_js and name.endswith((".js", ".jsx", ".ts", ".tsx")):
+                    has_js = True
+        return files, has_js
 
-    def _run_ruff_analysis(self, repo_dir: str) -> List[Dict[str, Any]]:
+    def _run_ruff(
+        self,
+        paths: List[str],
+        extra_args: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> List[NormalizedIssue]:
+        # One-line-per-violation output is matched with a compiled regex as
+        # it streams in; no intermediate dict per raw Ruff record
+        cmd = [self._ruff_bin, "check", *paths, f"--output-format={self._ruff_format}", *(extra_args or [])]
+        # stderr goes to a file, not a pipe: Ruff writes a line there per
+        # unparsable file and would block on a full pipe while we read stdout
+        stderr_file = tempfile.TemporaryFile()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, env=env)
+        watchdog = threading.Timer(RUFF_TIMEOUT, proc.kill)
+        watchdog.start()
+        cwd = os.getcwd()
+        issues = []
         try:
-            cmd = ["ruff", "check", repo_dir, "--output-format=json"]
-            result = subprocess.run(cmd, capture_output=True, timeout=120, text=True)
-            if result.returncode in [0, 1]:
-                try:
-                    issues = json.loads(result.stdout) if result.stdout else []
-                    return self._normalize_ruff_issues(issues)
-                except json.JSONDecodeError:
-                    return []
-            else:
-                logger.error(f"Ruff failed: {result.stderr}")
-                return []
-        except subprocess.TimeoutExpired:
-            return []
-        except FileNotFoundError:
-            logger.warning("Ruff not installed")
+            for line in proc.stdout:
+                match = _RUFF_LINE_RE.match(line)
+                if match is None:
+                    continue  # summary, fix hints and code frames
+                file_path, line_number, code, message = match.groups()
+                code = code.decode() if code else ""
+                message = message.decode(errors="replace")
+                issues.append(NormalizedIssue(
+                    os.path.join(cwd, os.fsdecode(file_path)),
+                    int(line_number),
+                    code,
+                    message,
+                    _python_category(code),
+                    "error" if code[:1] == "E" else "warning",
+                    message,
+                    "python",
+                ))
+            returncode = proc.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+            stderr_file.close()
+
+        if returncode in [0, 1]:
+            return issues
+        elif returncode < 0:
+            # Killed by the watchdog: the findings are incomplete, so fail the
+            # analysis rather than store it as a clean result
+            logger.error(f"Ruff timed out after {RUFF_TIMEOUT}s on {len(paths)} path(s)")
+            raise RuntimeError(f"Ruff timed out after {RUFF_TIMEOUT}s")
+        else:
+            logger.error(f"Ruff failed: {stderr.decode(errors='replace')}")
             return []
 
-    def _run_eslint_analysis(self, repo_dir: str) -> List[Dict[str, Any]]:
+    def _run_eslint_analysis(self, repo_dir: str) -> List[NormalizedIssue]:
+        eslint_bin = self.eslint.binary()
+        if not eslint_bin:
+            logger.warning("ESLint not installed")
+            return []
         try:
-            # Create a temporary eslint config for the analysis
-            eslint_config = {
-                "env": {"browser": True, "es2021": True, "node": True},
-                "parser": "@typescript-eslint/parser",
-                "plugins": ["@typescript-eslint"],
-                "rules": {
-                    "no-unused-vars": "warn",
-                    "no-console": "warn",
-                    "no-undef": "warn",
-                    "prefer-const": "warn",
-                    "no-var": "warn",
-                    "@typescript-eslint/no-unused-vars": "warn",
-                    "@typescript-eslint/no-explicit-any": "warn",
-                }
-            }
-            
-            config_path = Path(repo_dir) / ".eslintrc.json"
-            with open(config_path, "w") as f:
-                json.dump(eslint_config, f)
-
+            # The shared config and plugins live in the toolchain directory, so
+            # nothing is written into or installed in the checkout
             cmd = [
-                "eslint",
+                eslint_bin,
                 ".",
+                "--no-eslintrc",
+                "--config", str(self.eslint.config_path),
+                "--resolve-plugins-relative-to", str(self.eslint.root),
                 "--format=json",
                 "--ext=.js,.jsx,.ts,.tsx",
             ]
+            # ESLint has no line-delimited formatter; keep its report as raw
+            # bytes for orjson instead of decoding a second copy to str
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 timeout=120,
-                text=True,
                 cwd=repo_dir,
             )
 
-            # Cleanup config
-            config_path.unlink(missing_ok=True)
-
             if result.returncode in [0, 1]:
                 try:
-                    issues = json.loads(result.stdout) if result.stdout else []
+                    issues = orjson.loads(result.stdout) if result.stdout else []
                     return self._normalize_eslint_issues(issues)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     return []
             else:
-                logger.error(f"ESLint failed: {result.stderr}")
+                logger.error(f"ESLint failed: {result.stderr.decode(errors='replace')}")
                 return []
 
         except subprocess.TimeoutExpired:
             return []
-        except FileNotFoundError:
-            logger.warning("ESLint not installed")
-            return []
-
-    def _normalize_ruff_issues(self, issues: List[Dict]) -> List[Dict[str, Any]]:
-        normalized = []
-        for issue in issues:
-            normalized.append({
-                "file_path": issue.get("filename", ""),
-                "line_number": issue.get("location", {}).get("row", 0),
-                "issue_code": issue.get("code", ""),
-                "issue_name": issue.get("message", ""),
-                "category": self._categorize_issue("python", issue.get("code", "")),
-                "severity": "error" if issue.get("code", "").startswith("E") else "warning",
-                "message": issue.get("message", ""),
-                "language": "python",
-            })
-        return normalized
 
-    def _normalize_eslint_issues(self, files: List[Dict]) -> List[Dict[str, Any]]:
+    def _normalize_eslint_issues(self, files: List[Dict]) -> List[NormalizedIssue]:
         normalized = []
         for file_data in files:
             file_path = file_data.get("filePath", "")
             for message in file_data.get("messages", []):
-                normalized.append({
-                    "file_path": file_path,
-                    "line_number": message.get("line", 0),
-                    "issue_code": message.get("ruleId", ""),
-                    "issue_name": message.get("ruleId", ""),
-                    "category": self._categorize_issue("javascript", message.get("ruleId", "")),
-                    "severity": "error" if message.get("severity") == 2 else "warning",
-                    "message": message.get("message", ""),
-                    "language": "javascript",
-                })
+                rule_id = message.get("ruleId") or ""  # null for parse errors
+                normalized.append(NormalizedIssue(
+                    file_path,
+                    message.get("line", 0),
+                    rule_id,
+                    rule_id,
+                    _JS_CATEGORIES.get(rule_id, _SUGGESTION),
+                    "error" if message.get("severity") == 2 else "warning",
+                    message.get("message", ""),
+                    "javascript",
+                ))
         return normalized
 
     def _categorize_issue(self, language: str, code: str) -> str:
         if language == "python":
-            classifier = RuleClassifier()
-            classification = classifier.classify(code)
-            if classification.get('category') == RuleCategory.SAFE:
-                return IssueCategory.SAFE.value
-            elif classification.get('category') == RuleCategory.RISKY:
-                return IssueCategory.REVIEW.value
-            else:
-                return IssueCategory.SUGGESTION.value
-        else:
-            if code in ["no-console", "no-unused-vars", "prefer-const", "no-var"]:
-                return IssueCategory.SAFE.value
-            elif code in ["@typescript-eslint/no-unused-vars", "@typescript-eslint/no-explicit-any"]:
-                return IssueCategory.REVIEW.value
-            else:
-                return IssueCategory.SUGGESTION.value
+            return _python_category(code)
+        return _JS_CATEGORIES.get(code, _SUGGESTION)
+
 
-    def cleanup(self) -> None:
-        for temp_dir in self.temp_dirs:
-            if Path(temp_dir).exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        self.temp_dirs.clear()
+# Shared by every engine in the process so mirrors persist across analyses
+_REPO_CACHE = RepoCache()
+_ESLINT_TOOLCHAIN = ESLintToolchain()
@@ -5,6 +5,7 @@ specialized agents for comprehensive code analysis.
 """
 
 import asyncio
+import os
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -23,13 +24,15 @@ logger = logging.getLogger(__name__)
 class V3AnalysisEngine:
     """AGI Engineer v3 - Multi-agent analysis engine."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, max_parallel_agents: Optional[int] = None):
         """Initialize v3 engine with specialized agents.
         
         Args:
             config: Optional configuration for agents
+            max_parallel_agents: Cap on agents running at once (default: CPU count)
         """
         self.config = config or {}
+        self.max_parallel_agents = max_parallel_agents or os.cpu_count() or 1
         self.orchestrator = AgentOrchestrator()
         
         # Register specialized agents
@@ -104,7 +107,8 @@ class V3AnalysisEngine:
             results = await self.orchestrator.analyze_parallel(
                 repo_path=repo_path,
                 files=files,
-                agent_types=agent_types
+                agent_types=agent_types,
+                max_concurrency=self.max_parallel_agents
             )
         else:
             results = await self.orchestrator.analyze_sequential(
@@ -9,7 +9,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select, update
 from sqlalchemy.orm import sessionmaker
 from app.models.analysis_result import AnalysisResult, IssueCategory
 from agent.rule_classifier import RuleClassifier, RuleCategory
@@ -26,41 +26,43 @@ def fix_categories():
     classifier = RuleClassifier()
     
     try:
-        # Get all Python results
-        results = db.query(AnalysisResult).filter(
-            AnalysisResult.issue_code.isnot(None)
-        ).all()
+        # issue_code has only a few hundred distinct values, so classify each
+        # code once, bucket codes by target category, and issue one UPDATE
+        # per bucket (at most three)
+        codes = db.execute(
+            select(AnalysisResult.issue_code).where(AnalysisResult.issue_code.isnot(None)).distinct()
+        ).scalars().all()
         
-        updated_count = 0
-        fixed_count = 0
-        
-        for result in results:
+        buckets = {}
+        for code in codes:
             # Classify the issue
-            classification = classifier.classify(result.issue_code)
-            old_category = result.category
+            classification = classifier.classify(code)
             
             # Map RuleCategory to IssueCategory
             if classification.get('category') == RuleCategory.SAFE:
-                new_category = IssueCategory.SAFE
-                should_fix = 1
+                target = (IssueCategory.SAFE, 1)
             elif classification.get('category') == RuleCategory.RISKY:
-                new_category = IssueCategory.REVIEW
-                should_fix = 0
+                target = (IssueCategory.REVIEW, 0)
             else:
-                new_category = IssueCategory.SUGGESTION
-                should_fix = 0
+                target = (IssueCategory.SUGGESTION, 0)
+            buckets.setdefault(target, []).append(code)
+        
+        updated_count = 0
+        fixed_count = 0
+        
+        for (new_category, should_fix), bucket_codes in buckets.items():
+            # Update rows whose category changed
+            rowcount = db.execute(
+                update(AnalysisResult)
+                .where(AnalysisResult.issue_code.in_(bucket_codes), AnalysisResult.category != new_category)
+                .values(category=new_category, is_fixed=should_fix)
+            ).rowcount
             
-            # Update if changed
-            if result.category != new_category:
-                result.category = new_category
-                result.is_fixed = should_fix
-                updated_count += 1
-                
+            if rowcount:
+                updated_count += rowcount
                 if should_fix:
-                    fixed_count += 1
-                
-                print(f"Updated {result.issue_code} ({result.file_path}:{result.line_number})")
-                print(f"  {old_category.value} → {new_category.value} (fixed: {bool(should_fix)})")
+                    fixed_count += rowcount
+                print(f"Updated {rowcount} records across {len(bucket_codes)} codes → {new_category.value} (fixed: {bool(should_fix)})")
         
         # Commit changes
         db.commit()
@@ -8,15 +8,14 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from app.db import engine
 from app.db.base import Base
-from app.models.installation import Installation
-from app.models.repository import Repository
-from app.models.analysis_run import AnalysisRun
-from app.models.analysis_result import AnalysisResult
+import app.models  # noqa: F401 - the package registers every model on Base.metadata
 
 def init_db():
     """Create all database tables."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    # One transaction for the whole schema instead of one per CREATE
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
     print("✓ Database tables created successfully!")
 
 if __name__ == "__main__":
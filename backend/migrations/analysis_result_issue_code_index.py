@@ -0,0 +1,40 @@
+"""
+Database Migration: composite index for issue-code category backfills
+
+fix_categories.py enumerates distinct issue codes and updates rows by
+issue_code where the category differs, so (issue_code, category) serves
+both the DISTINCT scan and the UPDATE filter without a full table scan.
+
+Run:
+    python backend/migrations/analysis_result_issue_code_index.py
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db import engine
+
+
+def migrate():
+    """Apply migration."""
+    print("Analysis results: issue_code index")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_analysis_results_issue_code_category
+            ON analysis_results(issue_code, category)
+        """))
+        conn.commit()
+
+    print("✓ Migration completed successfully")
+    print()
+    print("Indexes created:")
+    print("  - ix_analysis_results_issue_code_category")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,55 @@
+"""
+Database Migration: unique index on installations.github_user
+
+The OAuth callback looks installations up by ``github_user`` on every login
+and upserts on conflict with that column, so it needs a unique index.
+
+Existing duplicate ``github_user`` rows must be merged before running this,
+otherwise index creation fails.
+
+Run:
+    python backend/migrations/installation_github_user_index.py
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db import engine
+
+
+def migrate():
+    """Apply migration."""
+    print("Installations: github_user unique index")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        duplicates = conn.execute(text("""
+            SELECT github_user, COUNT(*)
+            FROM installations
+            GROUP BY github_user
+            HAVING COUNT(*) > 1
+        """)).fetchall()
+
+        if duplicates:
+            print("[ERROR] Duplicate github_user rows must be merged first:")
+            for github_user, count in duplicates:
+                print(f"  - {github_user} ({count} rows)")
+            return
+
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_installations_github_user
+            ON installations(github_user)
+        """))
+        conn.commit()
+
+    print("✓ Migration completed successfully")
+    print()
+    print("Indexes created:")
+    print("  - ix_installations_github_user (unique)")
+
+
+if __name__ == "__main__":
+    migrate()
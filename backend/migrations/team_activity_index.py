@@ -0,0 +1,40 @@
+"""
+Database Migration: composite index for the team activity feed
+
+GET /api/teams/{team_id}/activity filters activity_logs by team_id and
+orders by created_at, so (team_id, created_at) turns the ORDER BY + LIMIT
+into an index range scan instead of a sort.
+
+Run:
+    python backend/migrations/team_activity_index.py
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db import engine
+
+
+def migrate():
+    """Apply migration."""
+    print("Team activity: composite index")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_activity_logs_team_created
+            ON activity_logs(team_id, created_at)
+        """))
+        conn.commit()
+
+    print("✓ Migration completed successfully")
+    print()
+    print("Indexes created:")
+    print("  - ix_activity_logs_team_created")
+
+
+if __name__ == "__main__":
+    migrate()
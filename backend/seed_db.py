@@ -2,6 +2,7 @@
 
 import sys
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.db import SessionLocal, engine
 from app.models.installation import Installation
@@ -12,6 +13,9 @@ from app.models.analysis_result import AnalysisResult, IssueCategory
 def seed_database():
     """Create demo data for testing."""
     db = SessionLocal()
+    # Progress lines are collected during the transaction and written once
+    # it has committed
+    log_lines = []
     
     try:
         print("🌱 Seeding database with demo data...")
@@ -30,9 +34,8 @@ def seed_database():
                 is_active=True
             )
             db.add(installation)
-            db.commit()
-            db.refresh(installation)
-            print(f"✓ Created demo installation (ID: {installation.id})")
+            db.flush()
+            log_lines.append(f"✓ Created demo installation (ID: {installation.id})")
         
         # Create demo repositories
         repos_data = [
@@ -56,9 +59,8 @@ def seed_database():
                     is_enabled=True
                 )
                 db.add(repo)
-                db.commit()
-                db.refresh(repo)
-                print(f"✓ Created repository: {repo.repo_full_name}")
+                db.flush()
+                log_lines.append(f"✓ Created repository: {repo.repo_full_name}")
             repos.append(repo)
         
         # Create demo analysis runs
@@ -144,99 +146,112 @@ def seed_database():
             },
         ]
         
-        for run_data in runs_data:
-            run = AnalysisRun(
-                repository_id=run_data["repo"].id,
-                github_event=run_data["event"],
-                github_branch=run_data["branch"],
-                github_commit_sha=run_data["commit"],
-                pull_request_number=None,
-                status=run_data["status"],
-                error_message=run_data.get("error"),
-                created_at=run_data["created"],
-                started_at=run_data["started"],
-                completed_at=run_data["completed"]
-            )
-            db.add(run)
-            db.commit()
-            db.refresh(run)
-            
+        # Runs and results go in with one bulk INSERT per table and a single
+        # commit; RETURNING hands back the run ids in payload order
+        runs_payload = [
+            {
+                "repository_id": run_data["repo"].id,
+                "github_event": run_data["event"],
+                "github_branch": run_data["branch"],
+                "github_commit_sha": run_data["commit"],
+                "pull_request_number": None,
+                "status": run_data["status"],
+                "error_message": run_data.get("error"),
+                "created_at": run_data["created"],
+                "started_at": run_data["started"],
+                "completed_at": run_data["completed"],
+            }
+            for run_data in runs_data
+        ]
+        run_ids = db.scalars(
+            insert(AnalysisRun).returning(AnalysisRun.id, sort_by_parameter_order=True),
+            runs_payload,
+        ).all()
+        
+        issues_templates = [
+            {
+                "file": "src/auth/login.py",
+                "line": 45,
+                "code": "SEC101",
+                "name": "Hardcoded credentials",
+                "category": IssueCategory.REVIEW,
+                "severity": "high",
+                "message": "Potential hardcoded password found in authentication module"
+            },
+            {
+                "file": "src/api/routes.py",
+                "line": 128,
+                "code": "PERF201",
+                "name": "N+1 query pattern",
+                "category": IssueCategory.SUGGESTION,
+                "severity": "medium",
+                "message": "Database query inside loop detected, consider using bulk fetch"
+            },
+            {
+                "file": "src/utils/helpers.py",
+                "line": 67,
+                "code": "CODE301",
+                "name": "Unused variable",
+                "category": IssueCategory.SAFE,
+                "severity": "low",
+                "message": "Variable 'temp_result' is assigned but never used"
+            },
+            {
+                "file": "src/models/user.py",
+                "line": 23,
+                "code": "TYPE401",
+                "name": "Missing type annotation",
+                "category": IssueCategory.SUGGESTION,
+                "severity": "low",
+                "message": "Function parameter lacks type hint, add for better code clarity"
+            },
+            {
+                "file": "src/config/settings.py",
+                "line": 12,
+                "code": "SEC102",
+                "name": "Debug mode enabled",
+                "category": IssueCategory.REVIEW,
+                "severity": "high",
+                "message": "DEBUG=True should not be used in production"
+            },
+        ]
+        
+        results_payload = []
+        for run_data, run_id in zip(runs_data, run_ids):
             # Add demo issues for completed runs
             if run_data["status"] == RunStatus.COMPLETED and run_data["issues"] > 0:
-                issues_templates = [
-                    {
-                        "file": "src/auth/login.py",
-                        "line": 45,
-                        "code": "SEC101",
-                        "name": "Hardcoded credentials",
-                        "category": IssueCategory.REVIEW,
-                        "severity": "high",
-                        "message": "Potential hardcoded password found in authentication module"
-                    },
-                    {
-                        "file": "src/api/routes.py",
-                        "line": 128,
-                        "code": "PERF201",
-                        "name": "N+1 query pattern",
-                        "category": IssueCategory.SUGGESTION,
-                        "severity": "medium",
-                        "message": "Database query inside loop detected, consider using bulk fetch"
-                    },
-                    {
-                        "file": "src/utils/helpers.py",
-                        "line": 67,
-                        "code": "CODE301",
-                        "name": "Unused variable",
-                        "category": IssueCategory.SAFE,
-                        "severity": "low",
-                        "message": "Variable 'temp_result' is assigned but never used"
-                    },
-                    {
-                        "file": "src/models/user.py",
-                        "line": 23,
-                        "code": "TYPE401",
-                        "name": "Missing type annotation",
-                        "category": IssueCategory.SUGGESTION,
-                        "severity": "low",
-                        "message": "Function parameter lacks type hint, add for better code clarity"
-                    },
-                    {
-                        "file": "src/config/settings.py",
-                        "line": 12,
-                        "code": "SEC102",
-                        "name": "Debug mode enabled",
-                        "category": IssueCategory.REVIEW,
-                        "severity": "high",
-                        "message": "DEBUG=True should not be used in production"
-                    },
-                ]
-                
                 for i in range(min(run_data["issues"], len(issues_templates))):
                     template = issues_templates[i % len(issues_templates)]
-                    result = AnalysisResult(
-                        run_id=run.id,
-                        file_path=template["file"],
-                        line_number=template["line"] + i,
-                        issue_code=template["code"],
-                        issue_name=template["name"],
-                        category=template["category"],
-                        severity=template["severity"],
-                        message=template["message"],
-                        is_fixed=0
-                    )
-                    db.add(result)
-                
-                db.commit()
-            
+                    results_payload.append({
+                        "run_id": run_id,
+                        "file_path": template["file"],
+                        "line_number": template["line"] + i,
+                        "issue_code": template["code"],
+                        "issue_name": template["name"],
+                        "category": template["category"],
+                        "severity": template["severity"],
+                        "message": template["message"],
+                        "is_fixed": 0,
+                    })
+        db.bulk_insert_mappings(AnalysisResult, results_payload)
+        
+        for run_data, run_id in zip(runs_data, run_ids):
             status_icon = "✓" if run_data["status"] == RunStatus.COMPLETED else "⏳" if run_data["status"] == RunStatus.IN_PROGRESS else "⚠" if run_data["status"] == RunStatus.FAILED else "⏸"
-            print(f"{status_icon} Created run #{run.id}: {run_data['repo'].repo_name} / {run_data['branch']} ({run_data['status'].value})")
+            log_lines.append(f"{status_icon} Created run #{run_id}: {run_data['repo'].repo_name} / {run_data['branch']} ({run_data['status'].value})")
         
-        print(f"\n✅ Database seeded successfully!")
-        print(f"📊 Created:")
-        print(f"   - 1 installation")
-        print(f"   - {len(repos)} repositories")
-        print(f"   - {len(runs_data)} analysis runs")
-        print(f"   - {sum(r['issues'] for r in runs_data)} issues")
+        db.commit()
+        
+        log_lines += [
+            "",
+            "✅ Database seeded successfully!",
+            "📊 Created:",
+            "   - 1 installation",
+            f"   - {len(repos)} repositories",
+            f"   - {len(runs_data)} analysis runs",
+            f"   - {sum(r['issues'] for r in runs_data)} issues",
+        ]
+        sys.stdout.write("\n".join(log_lines) + "\n")
+        sys.stdout.flush()
         
     except Exception as e:
         print(f"❌ Error seeding database: {str(e)}")
@@ -0,0 +1,379 @@
+"""Tests for the analysis Celery task helpers."""
+
+import csv
+import io
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.analysis_result import AnalysisResult, IssueCategory
+from app.models.analysis_run import AnalysisRun
+from app.models.repository import Repository
+from app.tasks import analysis_tasks
+from app.tasks.analysis_tasks import build_result_mappings, run_agi_engineer_analysis
+
+
+def _make_run(db_session: Session) -> AnalysisRun:
+    repo = Repository(
+        installation_id=1,
+        repo_name="repo",
+        repo_full_name="owner/repo",
+        github_repo_id=1,
+    )
+    db_session.add(repo)
+    db_session.flush()
+    run = AnalysisRun(
+        repository_id=repo.id,
+        github_event="push",
+        github_branch="main",
+        github_commit_sha="a" * 40,
+    )
+    db_session.add(run)
+    db_session.commit()
+    return run
+
+
+class TestBuildResultMappings:
+    """Analyzer output -> bulk insert mappings"""
+
+    def test_resolves_categories(self):
+        mappings = build_result_mappings(5, [
+            {"issue_code": "F401", "category": IssueCategory.SAFE},
+            {"issue_code": "E501", "category": "review"},
+            {"issue_code": "X1", "category": "bogus"},
+            {"issue_code": "X2"},
+        ])
+        assert [m["category"] for m in mappings] == [
+            IssueCategory.SAFE,
+            IssueCategory.REVIEW,
+            IssueCategory.SUGGESTION,
+            IssueCategory.SUGGESTION,
+        ]
+        assert all(m["run_id"] == 5 for m in mappings)
+        assert mappings[0]["issue_name"] == "F401"
+
+    def test_keeps_fixed_flag(self):
+        (mapping,) = build_result_mappings(1, [{"is_fixed": 1}])
+        assert mapping["is_fixed"] == 1
+
+    def test_bulk_insert_round_trip(self, db_session: Session):
+        run = _make_run(db_session)
+        mappings = build_result_mappings(run.id, [
+            {"file_path": "a.py", "line_number": i, "issue_code": "F401", "category": "safe"}
+            for i in range(1, 4)
+        ])
+        db_session.bulk_insert_mappings(AnalysisResult, mappings)
+        db_session.commit()
+
+        rows = db_session.query(AnalysisResult).filter_by(run_id=run.id).all()
+        assert len(rows) == 3
+        assert {r.category for r in rows} == {IssueCategory.SAFE}
+
+
+class TestRunAgiEngineerAnalysis:
+    """End-to-end ruff scan on a scratch repository"""
+
+    def test_classifies_and_marks_fixed(self, tmp_path):
+        (tmp_path / "mod.py").write_text("x = undefined_name\nimport os\n")
+
+        results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        by_code = {r["issue_code"]: r for r in results}
+        assert by_code["F401"]["category"] == IssueCategory.SAFE
+        assert by_code["F401"]["file_path"] == "mod.py"
+        assert by_code["F401"]["is_fixed"] == 1
+        assert by_code["F821"]["is_fixed"] == 0
+
+    def test_reuses_module_level_helpers(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(analysis_tasks._ORCHESTRATOR, "execute_plan", lambda path, safety_mode: calls.append(path))
+        (tmp_path / "mod.py").write_text("import os\n")
+
+        run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+        run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        assert calls == [str(tmp_path.resolve())] * 2
+
+
+    def test_rescan_covers_only_fixed_files(self, tmp_path, monkeypatch):
+        (tmp_path / "fixable.py").write_text("import os\n")
+        (tmp_path / "untouched.py").write_text("y = other_name\n")
+        rescans = []
+        real_iter_ruff = analysis_tasks.iter_ruff
+
+        def spy(root, paths=None, select=None):
+            rescans.append((paths, select))
+            return real_iter_ruff(root, paths, select)
+
+        monkeypatch.setattr(analysis_tasks, "iter_ruff", spy)
+
+        results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        assert rescans == [(None, None), ([str((tmp_path / "fixable.py").resolve())], ["F401", "F821"])]
+        by_code = {r["issue_code"]: r for r in results}
+        assert by_code["F401"]["is_fixed"] == 1
+        assert by_code["F821"]["is_fixed"] == 0
+
+
+    def test_rescan_catches_fix_within_mtime_granularity(self, tmp_path, monkeypatch):
+        fixable = tmp_path / "fixable.py"
+        fixable.write_text("import os\n")
+        stamp = fixable.stat().st_mtime_ns
+        real_execute_plan = analysis_tasks._ORCHESTRATOR.execute_plan
+
+        def fix_keeping_mtime(*args, **kwargs):
+            outcome = real_execute_plan(*args, **kwargs)
+            # A coarse-timestamp filesystem would record the rewrite like this
+            os.utime(fixable, ns=(stamp, stamp))
+            return outcome
+
+        monkeypatch.setattr(analysis_tasks._ORCHESTRATOR, "execute_plan", fix_keeping_mtime)
+
+        results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        assert [r["is_fixed"] for r in results if r["issue_code"] == "F401"] == [1]
+
+    def test_rescan_covers_stubs_and_dot_directories(self, tmp_path):
+        (tmp_path / "s.pyi").write_text("import os\n")
+        (tmp_path / ".ci").mkdir()
+        (tmp_path / ".ci" / "x.py").write_text("import os\n")
+        (tmp_path / "dangling.py").symlink_to(tmp_path / "missing.py")
+
+        results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        fixed = {r["file_path"]: r["is_fixed"] for r in results if r["issue_code"] == "F401"}
+        assert fixed == {"s.pyi": 1, os.path.join(".ci", "x.py"): 1}
+
+    def test_rescan_selects_only_rule_codes(self, tmp_path, monkeypatch):
+        (tmp_path / "fixable.py").write_text("import os\n")
+        rescans = []
+        real_iter_ruff = analysis_tasks.iter_ruff
+
+        def spy(root, paths=None, select=None):
+            rescans.append(select)
+            yield from real_iter_ruff(root, paths, select)
+            if paths is None:
+                # What newer Ruff reports for a file it cannot parse
+                yield {"filename": str(tmp_path / "broken.py"), "line": 1, "code": "invalid-syntax", "message": "x"}
+
+        monkeypatch.setattr(analysis_tasks, "iter_ruff", spy)
+
+        results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+        assert rescans == [None, ["F401"]]
+        assert {r["issue_code"]: r["is_fixed"] for r in results} == {"F401": 1, "invalid-syntax": 0}
+
+    def test_ruff_failure_is_an_error(self, tmp_path):
+        (tmp_path / "mod.py").write_text("import os\n")
+
+        with pytest.raises(RuntimeError, match="status 2"):
+            list(analysis_tasks.iter_ruff(str(tmp_path), select=["not-a-rule"]))
+
+
+class TestCloneRepository:
+    """Working copy reuse"""
+
+    def _git(self, cwd, *args):
+        return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+    def test_reuses_checkout_at_same_commit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(analysis_tasks, "REPOS_DIR", tmp_path)
+        repo_path = tmp_path / "owner_repo"
+        repo_path.mkdir()
+        self._git(repo_path, "init", "-q")
+        (repo_path / "mod.py").write_text("import os\n")
+        self._git(repo_path, "add", "mod.py")
+        self._git(repo_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+        sha = self._git(repo_path, "rev-parse", "HEAD")
+
+        # Simulate the previous run's auto-fix; there is no origin, so a fetch would fail
+        (repo_path / "mod.py").write_text("")
+
+        assert analysis_tasks.clone_repository("owner/repo", "main", "token", commit_sha=sha) == repo_path
+        assert (repo_path / "mod.py").read_text() == "import os\n"
+
+    def test_fetches_branch_tip_into_existing_checkout(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(analysis_tasks, "REPOS_DIR", tmp_path / "repos")
+        upstream = tmp_path / "upstream"
+        upstream.mkdir()
+        self._git(upstream, "init", "-q", "-b", "main")
+        (upstream / "mod.py").write_text("x = 1\n")
+        self._git(upstream, "add", "mod.py")
+        self._git(upstream, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "one")
+
+        repo_path = tmp_path / "repos" / "owner_repo"
+        self._git(tmp_path, "clone", "-q", "--depth=1", f"file://{upstream}", str(repo_path))
+        (repo_path / "mod.py").write_text("")
+
+        (upstream / "mod.py").write_text("x = 2\n")
+        self._git(upstream, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "two")
+        tip = self._git(upstream, "rev-parse", "HEAD")
+
+        analysis_tasks.clone_repository("owner/repo", "main", "token", commit_sha=tip)
+        assert self._git(repo_path, "rev-parse", "HEAD") == tip
+        assert (repo_path / "mod.py").read_text() == "x = 2\n"
+
+
+class TestSendStatusUpdate:
+    """Status updates go straight to Redis Pub/Sub"""
+
+    def test_publishes_run_update(self, monkeypatch):
+        published = []
+        monkeypatch.setattr(analysis_tasks, "publish_run_update", lambda run_id, msg: published.append((run_id, msg)))
+        analysis_tasks.send_status_update(3, {"type": "status_change"})
+        assert published == [(3, {"type": "status_change"})]
+
+    def test_publish_failure_is_swallowed(self, monkeypatch):
+        def boom(run_id, msg):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(analysis_tasks, "publish_run_update", boom)
+        analysis_tasks.send_status_update(3, {"type": "status_change"})
+
+
+def test_nested_paths_are_relative_to_repo(tmp_path):
+    pkg = tmp_path / "pkg" / "sub"
+    pkg.mkdir(parents=True)
+    (pkg / "mod.py").write_text("x = undefined_name\n")
+    (tmp_path / "top.py").write_text("y = other_name\n")
+
+    results = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=None)
+
+    assert sorted(r["file_path"] for r in results) == [os.path.join("pkg", "sub", "mod.py"), "top.py"]
+
+
+def test_repository_lock_serializes_holders(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis_tasks, "REPOS_DIR", tmp_path)
+    events = []
+
+    def hold(name):
+        with analysis_tasks.repository_lock("owner/repo"):
+            events.append(f"{name}-in")
+            time.sleep(0.05)
+            events.append(f"{name}-out")
+
+    threads = [threading.Thread(target=hold, args=(n,)) for n in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert events[0][0] == events[1][0]
+    assert events[2][0] == events[3][0]
+    assert (tmp_path / "owner_repo.lock").exists()
+
+
+class TestInsertResults:
+    """Bulk result storage"""
+
+    def test_sqlite_uses_bulk_insert(self, db_session: Session, monkeypatch):
+        monkeypatch.setattr(analysis_tasks, "COPY_THRESHOLD", 1)
+        run = _make_run(db_session)
+        analysis_tasks.insert_results(db_session, build_result_mappings(run.id, [{"issue_code": "F401"}] * 2))
+        db_session.commit()
+        assert db_session.query(AnalysisResult).filter_by(run_id=run.id).count() == 2
+
+    def test_copy_writes_csv_rows(self):
+        class FakeCursor:
+            def copy_expert(self, sql, buffer):
+                self.sql, self.data = sql, buffer.read()
+
+            def close(self):
+                pass
+
+        cursor = FakeCursor()
+
+        class FakeSession:
+            def connection(self):
+                return type("Conn", (), {"connection": type("Raw", (), {"cursor": lambda self: cursor})()})()
+
+        mappings = build_result_mappings(9, [{
+            "issue_code": "F401", "category": "safe", "message": "a,b", "suggestion": "", "before_code": "\\N",
+        }])
+        assert analysis_tasks._copy_results(FakeSession(), mappings)
+        assert cursor.sql.startswith("COPY analysis_results (run_id, file_path,")
+        assert "NULL '\\N'" in cursor.sql
+        row = next(csv.reader(io.StringIO(cursor.data)))
+        assert row[:8] == ["9", "", "0", "F401", "F401", "SAFE", "warning", "a,b"]
+        # Only a bare \N is NULL to Postgres; strings, even empty, are quoted
+        assert ',"a,b","","\\N",\\N,0,' in cursor.data
+
+
+def test_clone_repository_pins_requested_commit(tmp_path, monkeypatch):
+    git = TestCloneRepository()._git
+    monkeypatch.setattr(analysis_tasks, "REPOS_DIR", tmp_path / "repos")
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    git(upstream, "init", "-q", "-b", "main")
+    git(upstream, "config", "uploadpack.allowAnySHA1InWant", "true")
+    (upstream / "mod.py").write_text("x = 1\n")
+    git(upstream, "add", "mod.py")
+    git(upstream, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "one")
+    first = git(upstream, "rev-parse", "HEAD")
+    (upstream / "mod.py").write_text("x = 2\n")
+    git(upstream, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "two")
+
+    repo_path = tmp_path / "repos" / "owner_repo"
+    git(tmp_path, "clone", "-q", "--depth=1", f"file://{upstream}", str(repo_path))
+
+    analysis_tasks.clone_repository("owner/repo", "main", "token", commit_sha=first)
+    assert git(repo_path, "rev-parse", "HEAD") == first
+    assert (repo_path / "mod.py").read_text() == "x = 1\n"
+
+
+class FakeRedis:
+    """Minimal get/setex store standing in for Redis."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def test_scan_results_are_cached_by_tree(tmp_path, monkeypatch):
+    git = TestCloneRepository()._git
+    git(tmp_path, "init", "-q")
+    (tmp_path / "mod.py").write_text("import os\n")
+    git(tmp_path, "add", "mod.py")
+    git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    sha = git(tmp_path, "rev-parse", "HEAD")
+    cache = FakeRedis()
+    monkeypatch.setattr(analysis_tasks, "_cache", cache)
+
+    first = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=sha)
+    git(tmp_path, "reset", "--hard", "-q")
+    monkeypatch.setattr(analysis_tasks, "_scan_repository", lambda root: pytest.fail("cache miss"))
+    second = run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=sha)
+
+    assert len(cache.store) == 1
+    assert second == [{**r, "category": r["category"].value} for r in first]
+    assert build_result_mappings(1, second)[0]["category"] == IssueCategory.SAFE
+
+
+def test_scan_cache_is_keyed_by_ruff_and_schema_version(tmp_path, monkeypatch):
+    git = TestCloneRepository()._git
+    git(tmp_path, "init", "-q")
+    (tmp_path / "mod.py").write_text("import os\n")
+    git(tmp_path, "add", "mod.py")
+    git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    sha = git(tmp_path, "rev-parse", "HEAD")
+    cache = FakeRedis()
+    monkeypatch.setattr(analysis_tasks, "_cache", cache)
+    monkeypatch.setattr(analysis_tasks, "_scan_repository", lambda root: [])
+
+    monkeypatch.setattr(analysis_tasks, "ruff_version", lambda: "ruff 0.14.10")
+    run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=sha)
+    monkeypatch.setattr(analysis_tasks, "ruff_version", lambda: "ruff 0.15.0")
+    run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=sha)
+    monkeypatch.setattr(analysis_tasks, "SCAN_CACHE_VERSION", analysis_tasks.SCAN_CACHE_VERSION + 1)
+    run_agi_engineer_analysis(tmp_path, branch="main", commit_sha=sha)
+
+    assert len(cache.store) == 3
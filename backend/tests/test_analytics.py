@@ -0,0 +1,90 @@
+"""Tests for analytics endpoints."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.analysis_result import AnalysisResult, IssueCategory
+from app.models.analysis_run import AnalysisRun, RunStatus
+from app.models.repository import Repository
+from app.security import JWTManager
+
+
+@pytest.fixture
+def auth_headers():
+    """Bearer header carrying a valid JWT."""
+    token = JWTManager.create_token({"installation_id": 1})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def test_repository(db_session: Session):
+    """Create test repository."""
+    repo = Repository(
+        installation_id=1,
+        repo_name="test-repo",
+        repo_full_name="test-org/test-repo",
+        github_repo_id=100001,
+        is_enabled=True,
+    )
+    db_session.add(repo)
+    db_session.commit()
+    return repo
+
+
+def _add_run(db_session: Session, repository_id: int, status: RunStatus, issues: int) -> AnalysisRun:
+    run = AnalysisRun(
+        repository_id=repository_id,
+        github_event="push",
+        github_branch="main",
+        github_commit_sha="a" * 40,
+        status=status,
+    )
+    db_session.add(run)
+    db_session.flush()
+    for i in range(issues):
+        db_session.add(
+            AnalysisResult(
+                run_id=run.id,
+                file_path="app.py",
+                line_number=i + 1,
+                issue_code="F401",
+                issue_name="unused-import",
+                category=IssueCategory.SAFE,
+                severity="warning",
+                message="unused import",
+            )
+        )
+    db_session.commit()
+    return run
+
+
+class TestRepositoryHealth:
+    """Health score aggregates."""
+
+    def test_no_runs(self, client, auth_headers, test_repository):
+        response = client.get(
+            f"/api/analytics/repository-health?repository_id={test_repository.id}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["health_score"] == 100
+        assert data["message"] == "No analysis data available"
+
+    def test_aggregates_runs_and_issues(self, client, db_session, auth_headers, test_repository):
+        _add_run(db_session, test_repository.id, RunStatus.COMPLETED, issues=3)
+        _add_run(db_session, test_repository.id, RunStatus.COMPLETED, issues=0)
+        _add_run(db_session, test_repository.id, RunStatus.FAILED, issues=1)
+        _add_run(db_session, test_repository.id, RunStatus.PENDING, issues=0)
+
+        response = client.get(
+            f"/api/analytics/repository-health?repository_id={test_repository.id}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        metrics = response.json()["metrics"]
+        assert metrics["total_runs"] == 4
+        assert metrics["completed_runs"] == 2
+        assert metrics["success_rate"] == 50.0
+        assert metrics["total_issues"] == 4
+        assert metrics["average_issues_per_run"] == 1.0
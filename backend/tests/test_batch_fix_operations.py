@@ -290,6 +290,32 @@ class TestBatchApplication:
         assert result["summary"]["applied"] == 2
         assert "combined_patch_hash" in result
 
+    def test_apply_many_skips_remaining_fixes_for_missing_file(self, batch_service, db_session, sample_fixes):
+        """Once a fix fails on a missing file, later fixes for it are not attempted."""
+        for f in sample_fixes:
+            f.status = FixStatus.APPROVED
+        db_session.query.return_value.filter.return_value.all.return_value = sample_fixes
+        plan_context = create_plan_context(PlanTier.TEAM)
+
+        batch_service.application_service.can_apply_fix.return_value = True
+        batch_service.application_service.apply_fix.return_value = {
+            "success": False,
+            "error": "validation_failed",
+            "message": "Fix validation failed",
+        }
+
+        result = batch_service.apply_many(
+            fix_ids=[1, 2, 3],
+            user_id="test@example.com",
+            plan_context=plan_context,
+            ledger_writer=None,
+        )
+
+        attempted = [c.kwargs["fix_id"] for c in batch_service.application_service.apply_fix.call_args_list]
+        assert attempted == [1, 2]
+        assert result["summary"]["failed"] == 3
+        assert result["results"]["failed"][2]["message"] == "File does not exist: src/app.py"
+
     def test_apply_many_wrong_status(self, batch_service, db_session, sample_fixes):
         """Test application fails for non-approved fixes."""
         # sample_fixes[0].status is PROPOSED by default (not APPROVED)
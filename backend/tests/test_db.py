@@ -0,0 +1,51 @@
+"""Tests for request-scoped database sessions."""
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import db as db_module
+from app.db import db_session_middleware, get_db
+
+
+def _make_app():
+    app = FastAPI()
+    app.middleware("http")(db_session_middleware)
+    seen = []
+
+    @app.get("/session")
+    def read_session(db: Session = Depends(get_db)):
+        seen.append((db, db_module._session_ctx.get()))
+        return {"ok": True}
+
+    return app, seen
+
+
+def test_get_db_reuses_request_session():
+    app, seen = _make_app()
+    with TestClient(app) as client:
+        assert client.get("/session").status_code == 200
+        assert client.get("/session").status_code == 200
+
+    (first, first_ctx), (second, second_ctx) = seen
+    assert first is first_ctx
+    assert second is second_ctx
+    assert first is not second
+    assert db_module._session_ctx.get() is None
+
+
+def test_get_db_without_middleware_yields_private_session():
+    gen = get_db()
+    session = next(gen)
+    assert isinstance(session, Session)
+    gen.close()
+
+
+def test_scoped_session_is_thread_local_and_removable():
+    from app.db import ScopedSession
+
+    first = ScopedSession()
+    assert ScopedSession() is first
+    ScopedSession.remove()
+    assert ScopedSession() is not first
+    ScopedSession.remove()
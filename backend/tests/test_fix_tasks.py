@@ -0,0 +1,84 @@
+"""Tests for the AI fix Celery tasks."""
+
+import pytest
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from app.models.analysis_result import AnalysisResult, IssueCategory
+from app.models.analysis_run import AnalysisRun
+from app.models.code_fix import CodeFix, FixStatus
+from app.models.repository import Repository
+from app.tasks import fix_tasks
+
+
+class FakeProvider:
+    """Async AI provider that records what it was asked."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = []
+
+    async def generate_fix(self, issue: dict, code_snippet: str) -> str:
+        self.calls.append((issue, code_snippet))
+        if self.fail:
+            raise RuntimeError("provider down")
+        return "import sys\n"
+
+    async def generate_explanation(self, issue: dict, fix: str) -> str:
+        return "Removed unused import"
+
+
+@pytest.fixture
+def task_session(db_engine, monkeypatch):
+    """Point the task's scoped session at the test database."""
+    monkeypatch.setattr(fix_tasks, "ScopedSession", scoped_session(sessionmaker(bind=db_engine)))
+
+
+@pytest.fixture
+def result(db_session: Session):
+    repo = Repository(installation_id=1, repo_name="repo", repo_full_name="owner/repo", github_repo_id=1)
+    db_session.add(repo)
+    db_session.flush()
+    run = AnalysisRun(repository_id=repo.id, github_event="push", github_branch="main", github_commit_sha="a" * 40)
+    db_session.add(run)
+    db_session.flush()
+    row = AnalysisResult(
+        run_id=run.id,
+        file_path="mod.py",
+        line_number=1,
+        issue_code="F401",
+        issue_name="unused-import",
+        category=IssueCategory.SAFE,
+        severity="warning",
+        message="`os` imported but unused",
+        before_code="import os\nimport sys\n",
+    )
+    db_session.add(row)
+    db_session.commit()
+    return row
+
+
+def test_generate_code_fix_saves_fix(task_session, result, db_session, monkeypatch):
+    provider = FakeProvider()
+    monkeypatch.setattr(fix_tasks, "get_ai_provider", lambda name: provider)
+
+    outcome = fix_tasks.generate_code_fix(result.id)
+
+    assert outcome["status"] == "success"
+    issue, snippet = provider.calls[0]
+    assert issue["rule_id"] == "F401"
+    assert issue["name"] == "unused-import"
+    assert snippet == "import os\nimport sys\n"
+    fix = db_session.get(CodeFix, outcome["fix_id"])
+    assert fix.status == FixStatus.GENERATED
+    assert fix.fixed_code == "import sys\n"
+
+
+def test_generate_code_fix_records_failure(task_session, result, db_session, monkeypatch):
+    monkeypatch.setattr(fix_tasks, "get_ai_provider", lambda name: FakeProvider(fail=True))
+
+    outcome = fix_tasks.generate_code_fix(result.id)
+
+    assert outcome["status"] == "failed"
+    fix = db_session.query(CodeFix).filter_by(result_id=result.id).one()
+    assert fix.status == FixStatus.FAILED
+    assert fix.original_code == "import os\nimport sys\n"
@@ -0,0 +1,91 @@
+"""Tests for the fixes API endpoints."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.analysis_result import AnalysisResult, IssueCategory
+from app.models.analysis_run import AnalysisRun, RunStatus
+from app.models.code_fix import CodeFix, FixStatus
+from app.models.repository import Repository
+from app.security import JWTManager
+
+
+@pytest.fixture
+def auth_headers():
+    """Bearer header carrying a valid JWT."""
+    token = JWTManager.create_token({"installation_id": 1})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def result_with_fix(db_session: Session):
+    """Create an analysis result with one generated fix."""
+    repo = Repository(
+        installation_id=1,
+        repo_name="test-repo",
+        repo_full_name="test-org/test-repo",
+        github_repo_id=100001,
+    )
+    db_session.add(repo)
+    db_session.flush()
+    run = AnalysisRun(
+        repository_id=repo.id,
+        github_event="push",
+        github_branch="main",
+        github_commit_sha="a" * 40,
+        status=RunStatus.COMPLETED,
+    )
+    db_session.add(run)
+    db_session.flush()
+    result = AnalysisResult(
+        run_id=run.id,
+        file_path="app.py",
+        line_number=1,
+        issue_code="F401",
+        issue_name="unused-import",
+        category=IssueCategory.SAFE,
+        severity="warning",
+        message="unused import",
+        before_code="import os\n",
+        after_code="",
+    )
+    db_session.add(result)
+    db_session.flush()
+    fix = CodeFix(
+        result_id=result.id,
+        original_code="import os\n",
+        fixed_code="",
+        status=FixStatus.PROPOSED,
+    )
+    db_session.add(fix)
+    db_session.commit()
+    return result, fix
+
+
+class TestResultWithFix:
+    """GET /api/fixes/result/{result_id}/all"""
+
+    def test_lean_projection_by_default(self, client, auth_headers, result_with_fix):
+        result, fix = result_with_fix
+        response = client.get(f"/api/fixes/result/{result.id}/all", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["result"]["rule_id"] == "F401"
+        assert "before_code" not in data["result"]
+        assert data["fixes"] == [{"id": fix.id, "status": "proposed", "pr_url": None}]
+        assert data["has_fix"] is True
+        assert data["fix_status"] == "proposed"
+
+    def test_include_code(self, client, auth_headers, result_with_fix):
+        result, fix = result_with_fix
+        response = client.get(
+            f"/api/fixes/result/{result.id}/all?include_code=true", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["result"]["before_code"] == "import os\n"
+        assert data["fixes"][0]["original_code"] == "import os\n"
+
+    def test_missing_result(self, client, auth_headers):
+        response = client.get("/api/fixes/result/999/all", headers=auth_headers)
+        assert response.status_code == 404
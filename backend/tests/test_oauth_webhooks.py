@@ -151,3 +151,47 @@ def test_webhook_ignored_event(test_client):
 
     # Should handle gracefully
     assert response.status_code in [200, 500]
+
+
+
+def test_list_installations_paginates(client, db_session):
+    """Test installation listing honours limit/offset and reports the total."""
+    from app.models.installation import Installation
+
+    for i in range(3):
+        db_session.add(Installation(installation_id=1000 + i, github_user=f"user{i}"))
+    db_session.commit()
+
+    response = client.get("/installations/?limit=2&offset=1")
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "3"
+    assert [i["installation_id"] for i in response.json()] == [1001, 1002]
+
+
+def test_oauth_callback_upserts_installation(client, db_session, monkeypatch):
+    """Test repeated logins refresh a single installation row per GitHub user."""
+    from app.models.installation import Installation
+    from app.security import GitHubOAuthManager
+
+    tokens = iter(["token-1", "token-2"])
+
+    async def exchange_code_for_token(code):
+        return {"access_token": next(tokens)}
+
+    async def get_user_info(access_token):
+        return {"login": "octocat", "id": 42}
+
+    monkeypatch.setattr(GitHubOAuthManager, "exchange_code_for_token", staticmethod(exchange_code_for_token))
+    monkeypatch.setattr(GitHubOAuthManager, "get_user_info", staticmethod(get_user_info))
+
+    first = client.get("/oauth/callback?code=a&state=s")
+    second = client.get("/oauth/callback?code=b&state=s")
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["installation_id"] == second.json()["installation_id"]
+
+    installations = db_session.query(Installation).filter(
+        Installation.github_user == "octocat"
+    ).all()
+    assert len(installations) == 1
+    assert installations[0].access_token == "token-2"
@@ -0,0 +1,125 @@
+"""Tests for JWT and webhook signature helpers."""
+
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app import security
+from app.security import JWTManager
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    JWTManager.invalidate_cache()
+    yield
+    JWTManager.invalidate_cache()
+
+
+class TestVerifiedTokenCache:
+    """Verified-token cache behaviour."""
+
+    def test_repeat_verification_skips_decode(self, monkeypatch):
+        token = JWTManager.create_token({"installation_id": 7})
+        calls = []
+        real_decode = jwt.decode
+        monkeypatch.setattr(
+            security.jwt, "decode", lambda *a, **kw: calls.append(1) or real_decode(*a, **kw)
+        )
+
+        assert JWTManager.verify_token(token)["installation_id"] == 7
+        assert JWTManager.verify_token(token)["installation_id"] == 7
+        assert len(calls) == 1
+
+    def test_cached_claims_are_not_shared(self):
+        token = JWTManager.create_token({"installation_id": 7})
+        JWTManager.verify_token(token)["installation_id"] = 99
+        assert JWTManager.verify_token(token)["installation_id"] == 7
+
+    def test_invalid_token_is_not_cached(self):
+        with pytest.raises(jwt.InvalidTokenError):
+            JWTManager.verify_token("not-a-token")
+        with pytest.raises(jwt.InvalidTokenError):
+            JWTManager.verify_token("not-a-token")
+
+    def test_entry_expires_with_token(self, monkeypatch):
+        token = JWTManager.create_token({"installation_id": 7}, expires_delta=timedelta(seconds=5))
+        JWTManager.verify_token(token)
+
+        calls = []
+        real_decode = jwt.decode
+        real_time = security.time.time
+        monkeypatch.setattr(security.time, "time", lambda: real_time() + 10)
+        monkeypatch.setattr(
+            security.jwt, "decode", lambda *a, **kw: calls.append(1) or real_decode(*a, **kw)
+        )
+        JWTManager.verify_token(token)
+        assert len(calls) == 1
+
+    def test_invalidate_cache_forces_decode(self, monkeypatch):
+        token = JWTManager.create_token({"installation_id": 7})
+        JWTManager.verify_token(token)
+        JWTManager.invalidate_cache()
+
+        calls = []
+        real_decode = jwt.decode
+        monkeypatch.setattr(
+            security.jwt, "decode", lambda *a, **kw: calls.append(1) or real_decode(*a, **kw)
+        )
+        JWTManager.verify_token(token)
+        assert len(calls) == 1
+
+
+class TestWebhookSignature:
+    """validate_webhook_signature"""
+
+    def _sign(self, payload: bytes) -> str:
+        import hashlib
+        import hmac
+
+        from app.config import settings
+
+        return "sha256=" + hmac.new(
+            settings.webhook_secret.encode(), payload, hashlib.sha256
+        ).hexdigest()
+
+    def test_valid_signature(self):
+        payload = b'{"action": "opened"}'
+        assert security.validate_webhook_signature(payload, self._sign(payload))
+
+    def test_template_is_not_mutated_between_calls(self):
+        first, second = b"first", b"second"
+        assert security.validate_webhook_signature(first, self._sign(first))
+        assert security.validate_webhook_signature(second, self._sign(second))
+
+    def test_tampered_payload(self):
+        assert not security.validate_webhook_signature(b"tampered", self._sign(b"original"))
+
+    def test_malformed_signature(self):
+        assert not security.validate_webhook_signature(b"payload", "sha256=not-hex")
+        assert not security.validate_webhook_signature(b"payload", "sha1=abc")
+
+
+def test_token_near_expiry_is_not_cached(monkeypatch):
+    token = JWTManager.create_token({"installation_id": 7}, expires_delta=timedelta(seconds=3))
+    JWTManager.verify_token(token)
+
+    calls = []
+    real_decode = jwt.decode
+    monkeypatch.setattr(
+        security.jwt, "decode", lambda *a, **kw: calls.append(1) or real_decode(*a, **kw)
+    )
+    JWTManager.verify_token(token)
+    assert len(calls) == 1
+
+
+def test_authorization_url_is_encoded():
+    from urllib.parse import parse_qs, urlsplit
+
+    from app.security import GitHubOAuthManager
+
+    url = GitHubOAuthManager.get_authorization_url("a b&c")
+    assert " " not in url
+    query = parse_qs(urlsplit(url).query)
+    assert query["scope"] == ["repo admin:repo_hook read:org"]
+    assert query["state"] == ["a b&c"]
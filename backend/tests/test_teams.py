@@ -0,0 +1,88 @@
+"""Tests for team collaboration endpoints."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.team import Team, ActivityLog, ActivityType
+from app.models.user import User
+from app.security import JWTManager
+
+
+@pytest.fixture
+def auth_headers():
+    """Bearer header carrying a valid JWT."""
+    token = JWTManager.create_token({"user_id": 1, "installation_id": 1})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def team(db_session: Session):
+    """Create a team with two members."""
+    owner = User(name="owner")
+    member = User(name="member")
+    db_session.add_all([owner, member])
+    db_session.flush()
+    team = Team(name="Core", slug="core", owner_id=owner.id, members=[owner, member])
+    db_session.add(team)
+    db_session.commit()
+    return team
+
+
+class TestGetTeam:
+    """GET /api/teams/{team_id}"""
+
+    def test_returns_members(self, client, auth_headers, team):
+        response = client.get(f"/api/teams/{team.id}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["member_count"] == 2
+        assert sorted(m["name"] for m in data["members"]) == ["member", "owner"]
+
+    def test_missing_team(self, client, auth_headers):
+        response = client.get("/api/teams/999", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestTeamActivity:
+    """GET /api/teams/{team_id}/activity"""
+
+    def test_total_counts_all_rows_not_page(self, client, db_session, auth_headers, team):
+        for i in range(5):
+            db_session.add(
+                ActivityLog(
+                    team_id=team.id,
+                    user_id=team.owner_id,
+                    activity_type=ActivityType.RUN_CREATED,
+                    description=f"run {i}",
+                )
+            )
+        db_session.commit()
+
+        response = client.get(f"/api/teams/{team.id}/activity?limit=2", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["activities"]) == 2
+        assert data["total"] == 5
+
+    def test_empty_feed(self, client, auth_headers, team):
+        response = client.get(f"/api/teams/{team.id}/activity", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+
+class TestCreateTeam:
+    """POST /api/teams"""
+
+    def test_creates_team(self, client, auth_headers):
+        response = client.post(
+            "/api/teams", json={"name": "Platform", "slug": "platform"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["slug"] == "platform"
+
+    def test_duplicate_slug_rejected(self, client, auth_headers, team):
+        response = client.post(
+            "/api/teams", json={"name": "Other", "slug": team.slug}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Team slug already exists"
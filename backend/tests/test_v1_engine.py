@@ -0,0 +1,337 @@
+"""Tests for the V1 analysis engine wrapper."""
+
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from app.v1_engine import ESLintToolchain, NormalizedIssue, RepoCache, V1AnalysisEngine
+
+
+class FakeRepoCache:
+    """Hands out an empty directory instead of fetching."""
+
+    def __init__(self, path):
+        self.path = path
+
+    @contextmanager
+    def worktree(self, repo_url, ref):
+        yield self.path
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine whose checkout step is a no-op over one Python and one JS file."""
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "a.js").write_text("var x = 1;\n")
+    return V1AnalysisEngine(repo_cache=FakeRepoCache(tmp_path))
+
+
+def test_linters_run_concurrently(engine, monkeypatch):
+    def slow_ruff(repo_dir, files):
+        time.sleep(0.2)
+        return [NormalizedIssue("a.py", 1, "F401", "", "safe", "warning", "", "python")]
+
+    def slow_eslint(repo_dir):
+        time.sleep(0.2)
+        return [NormalizedIssue("a.js", 1, "no-var", "", "safe", "warning", "", "javascript")]
+
+    monkeypatch.setattr(engine, "_run_ruff_analysis", slow_ruff)
+    monkeypatch.setattr(engine, "_run_eslint_analysis", slow_eslint)
+
+    started = time.monotonic()
+    result = engine.analyze_repository("https://github.com/owner/repo")
+    elapsed = time.monotonic() - started
+
+    assert result["status"] == "completed"
+    assert result["ruff_count"] == 1
+    assert result["eslint_count"] == 1
+    assert [i.issue_code for i in result["issues"]] == ["F401", "no-var"]
+    assert elapsed < 0.35
+
+
+def test_linter_error_fails_analysis(engine, monkeypatch):
+    def broken(repo_dir, files):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(engine, "_run_ruff_analysis", broken)
+    monkeypatch.setattr(engine, "_run_eslint_analysis", lambda repo_dir: [])
+
+    result = engine.analyze_repository("https://github.com/owner/repo")
+
+    assert result["status"] == "failed"
+    assert result["error"] == "boom"
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """Local origin with two commits on main; returns (path, first_sha)."""
+    path = tmp_path / "upstream"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "uploadpack.allowAnySHA1InWant", "true")
+    _git(path, "config", "uploadpack.allowFilter", "true")
+    (path / "mod.py").write_text("x = 1\n")
+    _git(path, "add", "mod.py")
+    _git(path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "one")
+    first = _git(path, "rev-parse", "HEAD")
+    (path / "mod.py").write_text("x = 2\n")
+    _git(path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "two")
+    return path, first
+
+
+class TestRepoCache:
+    """Bare mirrors with disposable worktrees"""
+
+    def test_worktree_checks_out_requested_commit(self, tmp_path, upstream):
+        origin, first = upstream
+        cache = RepoCache(root=tmp_path / "cache")
+
+        with cache.worktree(f"file://{origin}", first) as worktree:
+            assert _git(worktree, "rev-parse", "HEAD") == first
+            assert (worktree / "mod.py").read_text() == "x = 1\n"
+
+        assert not worktree.exists()
+        assert len(list((tmp_path / "cache").glob("*.git"))) == 1
+
+    def test_mirror_is_reused_across_analyses(self, tmp_path, upstream):
+        origin, first = upstream
+        cache = RepoCache(root=tmp_path / "cache")
+
+        with cache.worktree(f"file://{origin}", first):
+            pass
+        with cache.worktree(f"file://{origin}", "main") as worktree:
+            assert (worktree / "mod.py").read_text() == "x = 2\n"
+
+        assert len(list((tmp_path / "cache").glob("*.git"))) == 1
+
+    def test_worktree_materializes_only_lintable_files(self, tmp_path, upstream):
+        origin, _ = upstream
+        (origin / "notes.md").write_text("docs\n")
+        (origin / "web").mkdir()
+        (origin / "web" / "app.js").write_text("var x = 1;\n")
+        _git(origin, "add", ".")
+        _git(origin, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "three")
+        cache = RepoCache(root=tmp_path / "cache")
+
+        with cache.worktree(f"file://{origin}", "main") as worktree:
+            assert (worktree / "mod.py").read_text() == "x = 2\n"
+            assert (worktree / "web" / "app.js").exists()
+            assert not (worktree / "notes.md").exists()
+
+    def test_evicts_beyond_max_entries(self, tmp_path, upstream):
+        origin, first = upstream
+        cache = RepoCache(root=tmp_path / "cache", max_entries=1)
+
+        with cache.worktree(f"file://{origin}", first):
+            pass
+        with cache.worktree(f"file://{origin}/.", first):
+            pass
+
+        assert len(list((tmp_path / "cache").glob("*.git"))) == 1
+        assert len(list((tmp_path / "cache").glob("*.lock"))) == 2
+
+    def test_mirror_in_use_is_not_evicted(self, tmp_path, upstream):
+        origin, first = upstream
+        cache = RepoCache(root=tmp_path / "cache", max_entries=1)
+
+        with cache.worktree(f"file://{origin}", first) as worktree:
+            with cache.worktree(f"file://{origin}/.", first):
+                pass
+            assert _git(worktree, "rev-parse", "HEAD") == first
+
+        assert len(list((tmp_path / "cache").glob("*.git"))) == 2
+
+
+def test_ruff_analysis_streams_and_normalizes(tmp_path):
+    (tmp_path / "mod.py").write_text("import os\nx = undefined_name\n")
+
+    issues = V1AnalysisEngine()._run_ruff_analysis(str(tmp_path))
+
+    assert sorted(i.issue_code for i in issues) == ["F401", "F821"]
+    assert all(i.language == "python" for i in issues)
+    assert {i.line_number for i in issues} == {1, 2}
+    assert {i.file_path for i in issues} == {str(tmp_path / "mod.py")}
+    assert all(not i.message.startswith("[*]") for i in issues)
+
+
+def test_ruff_analysis_shards_large_trees(tmp_path, monkeypatch):
+    from app import v1_engine
+
+    for i in range(6):
+        (tmp_path / f"mod{i}.py").write_text("import os\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "skip.py").write_text("import os\n")
+    monkeypatch.setattr(v1_engine, "RUFF_SHARD_MIN_FILES", 2)
+    monkeypatch.setattr(v1_engine.os, "cpu_count", lambda: 3)
+    engine = V1AnalysisEngine()
+    calls = []
+    run_ruff = engine._run_ruff
+    monkeypatch.setattr(engine, "_run_ruff", lambda paths, *a: calls.append(paths) or run_ruff(paths, *a))
+
+    issues = engine._run_ruff_analysis(str(tmp_path))
+
+    assert len(calls) == 3
+    assert sorted(len(c) for c in calls) == [2, 2, 2]
+    assert sorted(Path(i.file_path).name for i in issues) == [f"mod{i}.py" for i in range(6)]
+
+
+def _fake_ruff(tmp_path, body):
+    script = tmp_path / "fake-ruff"
+    script.write_text("#!/bin/sh\n" + body + "\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_ruff_stderr_flood_does_not_block(tmp_path):
+    engine = V1AnalysisEngine()
+    # Far more than a pipe buffer of stderr before any stdout
+    engine._ruff_bin = _fake_ruff(
+        tmp_path,
+        "head -c 1000000 /dev/zero | tr '\\0' e >&2\n"
+        "echo 'a.py:1:1: F401 [*] `os` imported but unused'\n"
+        "exit 1",
+    )
+    engine._ruff_format = "concise"
+
+    issues = engine._run_ruff([str(tmp_path)])
+
+    assert [i.issue_code for i in issues] == ["F401"]
+
+
+def test_ruff_concise_lines_keep_diagnostic_codes(tmp_path):
+    engine = V1AnalysisEngine()
+    engine._ruff_bin = _fake_ruff(
+        tmp_path,
+        "echo 'a.py:1:5: invalid-syntax: Expected an expression'\n"
+        "echo 'a.py:2:1: F401 [*] `os` imported but unused'\n"
+        "exit 1",
+    )
+    engine._ruff_format = "concise"
+
+    issues = engine._run_ruff([str(tmp_path)])
+
+    assert [(i.issue_code, i.message) for i in issues] == [
+        ("invalid-syntax", "Expected an expression"),
+        ("F401", "`os` imported but unused"),
+    ]
+
+
+def test_ruff_concise_lines_allow_colons_in_paths(tmp_path):
+    engine = V1AnalysisEngine()
+    engine._ruff_bin = _fake_ruff(
+        tmp_path,
+        "echo 'a:b.py:3:1: F821 Undefined name `x`'\n"
+        "exit 1",
+    )
+    engine._ruff_format = "concise"
+
+    issues = engine._run_ruff([str(tmp_path)])
+
+    assert [(Path(i.file_path).name, i.line_number, i.issue_code) for i in issues] == [("a:b.py", 3, "F821")]
+
+
+def test_ruff_timeout_fails_analysis(engine, monkeypatch):
+    from app import v1_engine
+
+    monkeypatch.setattr(v1_engine, "RUFF_TIMEOUT", 0.2)
+    engine._ruff_bin = _fake_ruff(engine.repo_cache.path, "exec sleep 5")
+    monkeypatch.setattr(engine, "_run_eslint_analysis", lambda repo_dir: [])
+
+    result = engine.analyze_repository("https://github.com/owner/repo")
+
+    assert result["status"] == "failed"
+    assert "timed out" in result["error"]
+
+
+def test_categorize_issue_lookups():
+    engine = V1AnalysisEngine()
+
+    assert engine._categorize_issue("python", "F401") == "safe"
+    assert engine._categorize_issue("python", "F841") == "review"
+    assert engine._categorize_issue("python", "ZZZ999") == "suggestion"
+    assert engine._categorize_issue("javascript", "no-var") == "safe"
+    assert engine._categorize_issue("javascript", "@typescript-eslint/no-explicit-any") == "review"
+    assert engine._categorize_issue("javascript", "semi") == "suggestion"
+
+
+def test_missing_linters_are_skipped(tmp_path, monkeypatch):
+    from app import v1_engine
+
+    monkeypatch.setattr(v1_engine.shutil, "which", lambda name: None)
+    engine = V1AnalysisEngine(eslint=ESLintToolchain(root=tmp_path / "eslint"))
+    (tmp_path / "mod.py").write_text("import os\n")
+
+    assert engine._run_ruff_analysis(str(tmp_path)) == []
+    assert engine._run_eslint_analysis(str(tmp_path)) == []
+    assert not (tmp_path / ".eslintrc.json").exists()
+
+
+def test_eslint_toolchain_prefers_shared_install(tmp_path, monkeypatch):
+    from app import v1_engine
+
+    monkeypatch.setattr(v1_engine.shutil, "which", lambda name: None)
+    local = tmp_path / "node_modules" / ".bin" / "eslint"
+    local.parent.mkdir(parents=True)
+    local.touch()
+    toolchain = ESLintToolchain(root=tmp_path)
+
+    assert toolchain.binary() == str(local)
+    assert toolchain.config_path.read_bytes() == v1_engine._ESLINT_CONFIG
+
+
+def test_normalize_eslint_issues_returns_tuples():
+    report = [{"filePath": "/r/a.js", "messages": [
+        {"ruleId": "no-var", "line": 3, "severity": 2, "message": "Unexpected var"},
+        {"ruleId": None, "line": 1, "severity": 2, "message": "Parsing error"},
+    ]}]
+
+    issues = V1AnalysisEngine()._normalize_eslint_issues(report)
+
+    assert issues[0] == NormalizedIssue("/r/a.js", 3, "no-var", "no-var", "safe", "error", "Unexpected var", "javascript")
+    assert issues[1].issue_code == ""
+    assert issues[1].category == "suggestion"
+
+
+def test_analysis_of_known_commit_is_reused(engine, monkeypatch):
+    calls = []
+
+    def ruff(repo_dir, files):
+        calls.append(repo_dir)
+        return [NormalizedIssue("a.py", 1, "F401", "", "safe", "warning", "", "python")]
+
+    monkeypatch.setattr(engine, "_run_ruff_analysis", ruff)
+    monkeypatch.setattr(engine, "_run_eslint_analysis", lambda repo_dir: [])
+    url = "https://github.com/owner/repo"
+
+    first = engine.analyze_repository(url, commit_sha="a" * 40)
+    again = engine.analyze_repository(url, branch="feature", commit_sha="a" * 40)
+    assert len(calls) == 1
+    assert again["issues"] == first["issues"] and again["issues"] is not first["issues"]
+    assert again["branch"] == "feature"
+
+    engine.analyze_repository(url, commit_sha="a" * 40, force=True)
+    engine.analyze_repository(url)  # branch-only runs are never cached
+    engine.analyze_repository(url)
+    assert len(calls) == 4
+
+
+def test_linters_without_matching_files_are_not_run(tmp_path, monkeypatch):
+    (tmp_path / "README.md").write_text("docs\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    engine = V1AnalysisEngine(repo_cache=FakeRepoCache(tmp_path))
+    seen = []
+    monkeypatch.setattr(engine, "_run_ruff_analysis", lambda repo_dir, files: seen.append(files) or [])
+    monkeypatch.setattr(engine, "_run_eslint_analysis", lambda repo_dir: pytest.fail("no JS files"))
+
+    result = engine.analyze_repository("https://github.com/owner/repo")
+
+    assert result["status"] == "completed"
+    assert seen == [[str(tmp_path / "pkg" / "mod.py")]]
@@ -0,0 +1,57 @@
+"""Tests for the v3 multi-agent engine."""
+
+import asyncio
+
+from agent.specialized.base_agent import AgentResult, AgentType
+from agent.specialized.orchestrator import AgentOrchestrator
+from app.v3_engine import V3AnalysisEngine
+
+
+class FakeAgent:
+    """Records how many agents are inside analyze() at once."""
+
+    def __init__(self, agent_type, tracker):
+        self.agent_type = agent_type
+        self.tracker = tracker
+
+    async def analyze(self, repo_path, files):
+        self.tracker["running"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        await asyncio.sleep(0.01)
+        self.tracker["running"] -= 1
+        return AgentResult(self.agent_type, [], {}, "ok", 0.0)
+
+
+def _orchestrator(tracker):
+    orchestrator = AgentOrchestrator()
+    for agent_type in AgentType:
+        orchestrator.register_agent(FakeAgent(agent_type, tracker))
+    return orchestrator
+
+
+def test_analyze_parallel_caps_concurrency():
+    tracker = {"running": 0, "peak": 0}
+
+    result = asyncio.run(_orchestrator(tracker).analyze_parallel("/repo", files=[], max_concurrency=2))
+
+    assert tracker["peak"] == 2
+    assert result["errors"] == []
+    assert len(result["agents_run"]) == len(AgentType)
+
+
+def test_analyze_parallel_unbounded_by_default():
+    tracker = {"running": 0, "peak": 0}
+
+    asyncio.run(_orchestrator(tracker).analyze_parallel("/repo", files=[]))
+
+    assert tracker["peak"] == len(AgentType)
+
+
+def test_engine_passes_its_cap_to_orchestrator():
+    engine = V3AnalysisEngine(max_parallel_agents=1)
+    tracker = {"running": 0, "peak": 0}
+    engine.orchestrator = _orchestrator(tracker)
+
+    asyncio.run(engine.analyze_repository("/repo", files=[]))
+
+    assert tracker["peak"] == 1
@@ -0,0 +1,235 @@
+"""Tests for the /webhooks/github analysis trigger."""
+
+import hashlib
+import hmac
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.db.base import Base
+from app.models.analysis_run import AnalysisRun, RunStatus
+from app.models.repository import Repository
+from app.routers import webhooks
+
+
+class FakeRedis:
+    """The SET NX / DELETE subset the dedup gate uses, safe across threads."""
+
+    def __init__(self, before_set=None):
+        self.keys = set()
+        self.lock = threading.Lock()
+        self.before_set = before_set
+
+    def set(self, key, value, nx=False, ex=None):
+        if self.before_set:
+            self.before_set()
+        with self.lock:
+            if nx and key in self.keys:
+                return None
+            self.keys.add(key)
+            return True
+
+    def delete(self, key):
+        with self.lock:
+            self.keys.discard(key)
+
+
+@pytest.fixture(autouse=True)
+def dedup_redis(monkeypatch):
+    """Keep the dedup gate off a real Redis."""
+    fake = FakeRedis()
+    monkeypatch.setattr(webhooks, "_get_dedup_client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Capture analysis enqueues instead of talking to the broker."""
+    run_ids = []
+    monkeypatch.setattr(webhooks, "enqueue_analysis", run_ids.append)
+    return run_ids
+
+
+@pytest.fixture
+def tracked_repository(db_session: Session):
+    """Create an enabled repository known to GitHub as id 4242."""
+    repo = Repository(
+        installation_id=1,
+        repo_name="repo",
+        repo_full_name="owner/repo",
+        github_repo_id=4242,
+        is_enabled=True,
+    )
+    db_session.add(repo)
+    db_session.commit()
+    return repo
+
+
+def _post(client, event: str, payload: dict):
+    body = json.dumps(payload).encode()
+    signature = "sha256=" + hmac.new(
+        settings.webhook_secret.encode(), body, hashlib.sha256
+    ).hexdigest()
+    return client.post(
+        "/webhooks/github",
+        content=body,
+        headers={
+            "X-Hub-Signature-256": signature,
+            "X-GitHub-Event": event,
+            "Content-Type": "application/json",
+        },
+    )
+
+
+def _push_payload(commit_sha: str) -> dict:
+    return {
+        "ref": "refs/heads/main",
+        "after": commit_sha,
+        "repository": {"id": 4242, "full_name": "owner/repo"},
+    }
+
+
+def _pr_payload(action: str, commit_sha: str) -> dict:
+    return {
+        "action": action,
+        "repository": {"id": 4242, "full_name": "owner/repo"},
+        "pull_request": {"number": 7, "head": {"ref": "feature", "sha": commit_sha}},
+    }
+
+
+class TestPushEvent:
+    """push deliveries"""
+
+    def test_queues_run(self, client, db_session, queued, tracked_repository):
+        response = _post(client, "push", _push_payload("a" * 40))
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+        assert queued == [data["run_id"]]
+        assert db_session.query(AnalysisRun).count() == 1
+
+    def test_duplicate_delivery_is_deduped(self, client, db_session, queued, tracked_repository):
+        first = _post(client, "push", _push_payload("a" * 40)).json()
+        second = _post(client, "push", _push_payload("a" * 40)).json()
+        assert second["status"] == "deduped"
+        assert second["run_id"] == first["run_id"]
+        assert queued == [first["run_id"]]
+        assert db_session.query(AnalysisRun).count() == 1
+
+    def test_new_commit_is_not_deduped(self, client, db_session, queued, tracked_repository):
+        _post(client, "push", _push_payload("a" * 40))
+        response = _post(client, "push", _push_payload("b" * 40))
+        assert response.json()["status"] == "queued"
+        assert len(queued) == 2
+
+    def test_failed_enqueue_lets_redelivery_retry(self, client, db_session, monkeypatch, dedup_redis, tracked_repository):
+        def broker_down(run_id):
+            raise ConnectionError("broker unavailable")
+
+        monkeypatch.setattr(webhooks, "enqueue_analysis", broker_down)
+        response = _post(client, "push", _push_payload("a" * 40))
+        assert response.status_code == 500
+        assert db_session.query(AnalysisRun).count() == 0
+
+        run_ids = []
+        monkeypatch.setattr(webhooks, "enqueue_analysis", run_ids.append)
+        assert dedup_redis.keys == set()
+        retry = _post(client, "push", _push_payload("a" * 40)).json()
+        assert retry["status"] == "queued"
+        assert run_ids == [retry["run_id"]]
+
+    def test_concurrent_duplicates_enqueue_once(self, tmp_path, monkeypatch, queued):
+        # Each delivery gets its own database, standing in for two READ
+        # COMMITTED transactions that cannot see each other's pending insert
+        def make_session(name):
+            engine = create_engine(f"sqlite:///{tmp_path / name}", connect_args={"check_same_thread": False})
+            Base.metadata.create_all(bind=engine)
+            session = sessionmaker(bind=engine)()
+            session.add(Repository(
+                installation_id=1,
+                repo_name="repo",
+                repo_full_name="owner/repo",
+                github_repo_id=4242,
+                is_enabled=True,
+            ))
+            session.commit()
+            return session
+
+        sessions = [make_session("first.db"), make_session("second.db")]
+        # Both deliveries reach the gate before either inserts
+        barrier = threading.Barrier(2)
+        monkeypatch.setattr(webhooks, "_get_dedup_client", lambda fake=FakeRedis(barrier.wait): fake)
+
+        def deliver(db):
+            return webhooks.handle_push_event(_push_payload("a" * 40), None, db)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(deliver, sessions))
+
+        assert sorted(r["status"] for r in responses) == ["deduped", "queued"]
+        assert len(queued) == 1
+        assert sum(db.query(AnalysisRun).count() for db in sessions) == 1
+        for db in sessions:
+            db.close()
+
+    def test_untracked_repository(self, client, queued):
+        response = _post(client, "push", _push_payload("a" * 40))
+        assert response.json()["status"] == "skipped"
+        assert queued == []
+
+    def test_disabled_repository(self, client, db_session, queued, tracked_repository):
+        tracked_repository.is_enabled = False
+        db_session.commit()
+        response = _post(client, "push", _push_payload("a" * 40))
+        assert response.json()["status"] == "skipped"
+        assert queued == []
+        assert db_session.query(AnalysisRun).count() == 0
+
+    def test_run_fields_are_populated(self, client, db_session, queued, tracked_repository):
+        run_id = _post(client, "push", _push_payload("a" * 40)).json()["run_id"]
+        run = db_session.get(AnalysisRun, run_id)
+        assert run.repository_id == tracked_repository.id
+        assert run.github_branch == "main"
+        assert run.status == RunStatus.PENDING
+        assert run.created_at is not None
+
+
+class TestPullRequestEvent:
+    """pull_request deliveries"""
+
+    def test_synchronize_dedupes_same_head(self, client, queued, tracked_repository):
+        first = _post(client, "pull_request", _pr_payload("opened", "c" * 40)).json()
+        second = _post(client, "pull_request", _pr_payload("synchronize", "c" * 40)).json()
+        assert first["status"] == "queued"
+        assert first["pr"] == 7
+        assert second["status"] == "deduped"
+        assert queued == [first["run_id"]]
+
+    def test_ignored_action(self, client, queued, tracked_repository):
+        response = _post(client, "pull_request", _pr_payload("closed", "c" * 40))
+        assert response.json()["status"] == "ignored"
+        assert queued == []
+
+
+def test_unknown_event_is_ignored(client):
+    response = _post(client, "issues", {"action": "opened"})
+    assert response.json() == {"status": "ignored", "event": "issues"}
+
+
+def test_review_event_queues_run(client, queued, tracked_repository):
+    response = _post(client, "pull_request_review", _pr_payload("submitted", "d" * 40))
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["event"] == "pull_request_review"
+    assert data["pr"] == 7
+    assert queued == [data["run_id"]]
+
+
+def test_pr_fields_tolerate_missing_head():
+    assert webhooks._pr_fields({"pull_request": {"number": 3}}) == (3, None, None)
+    assert webhooks._pr_fields({}) == (None, None, None)
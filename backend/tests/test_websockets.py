@@ -0,0 +1,119 @@
+"""Tests for WebSocket broadcast fan-out."""
+
+import asyncio
+import json
+
+from app.routers import websockets
+from app.routers.websockets import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in recording frames sent to a client."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(json.loads(data))
+
+
+def test_run_update_reaches_all_clients():
+    async def scenario():
+        manager = ConnectionManager()
+        clients = [FakeWebSocket(), FakeWebSocket()]
+        for ws in clients:
+            await manager.connect(ws, run_id=1)
+        await manager.send_run_update(1, {"status": "completed"})
+        return clients
+
+    clients = asyncio.run(scenario())
+    assert all(ws.sent == [{"status": "completed"}] for ws in clients)
+
+
+def test_failed_and_slow_clients_are_dropped(monkeypatch):
+    monkeypatch.setattr(websockets, "SEND_TIMEOUT", 0.05)
+
+    async def scenario():
+        manager = ConnectionManager()
+        healthy, broken, slow = FakeWebSocket(), FakeWebSocket(fail=True), FakeWebSocket(delay=1.0)
+        for ws in (healthy, broken, slow):
+            await manager.connect(ws, user_id=9)
+        await manager.send_dashboard_update(9, {"type": "stats"})
+        return manager, healthy
+
+    manager, healthy = asyncio.run(scenario())
+    assert healthy.sent == [{"type": "stats"}]
+    assert list(manager.dashboard_connections[9]) == [healthy]
+
+
+def test_update_without_subscribers_is_noop():
+    asyncio.run(ConnectionManager().send_run_update(404, {"status": "completed"}))
+
+
+def test_relay_routes_channels_to_local_sockets():
+    async def scenario():
+        manager = websockets.manager
+        run_ws, dash_ws = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(run_ws, run_id=5)
+        await manager.connect(dash_ws, user_id=6)
+        try:
+            await websockets.relay_message("ws:run:5", b'{"status": "in_progress"}')
+            await websockets.relay_message("ws:dash:6", b'{"type": "stats"}')
+        finally:
+            manager.disconnect(run_ws, run_id=5)
+            manager.disconnect(dash_ws, user_id=6)
+        return run_ws, dash_ws
+
+    run_ws, dash_ws = asyncio.run(scenario())
+    assert run_ws.sent == [{"status": "in_progress"}]
+    assert dash_ws.sent == [{"type": "stats"}]
+
+
+def test_publish_run_update_uses_run_channel(monkeypatch):
+    published = []
+
+    class FakeRedis:
+        def publish(self, channel, data):
+            published.append((channel, data))
+
+    monkeypatch.setattr(websockets, "_publisher", FakeRedis())
+    websockets.publish_run_update(3, {"status": "completed"})
+    assert published == [("ws:run:3", b'{"status":"completed"}')]
+
+
+def test_connection_group_compacts_dead_slots():
+    from app.routers.websockets import ConnectionGroup
+
+    group = ConnectionGroup()
+    sockets = [FakeWebSocket() for _ in range(8)]
+    for ws in sockets:
+        group.add(ws)
+
+    group.discard(sockets[0])
+    group.discard(sockets[1])
+    assert len(group) == 6
+    assert len(group._slots) == 8  # two dead slots tolerated
+
+    group.discard(sockets[2])
+    assert len(group._slots) == 5  # compacted past a quarter dead
+    assert list(group) == sockets[3:]
+
+
+def test_disconnect_drops_empty_groups():
+    async def scenario():
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, run_id=1)
+        manager.disconnect(ws, run_id=1)
+        return manager
+
+    assert asyncio.run(scenario()).active_connections == {}
@@ -9,4 +9,4 @@ if [ -d "../venv" ]; then
 fi
 
 echo "🚀 Starting Celery worker..."
-celery -A app.tasks.celery_app worker --loglevel=info --concurrency=2
+celery -A app.tasks.celery_app worker --loglevel=info --autoscale=8,2 -Ofair
@@ -1,6 +1,5 @@
 """Shared test fixtures"""
 import pytest
-import tempfile
 import os
 import sys
 
@@ -11,30 +10,23 @@ if AGENT_DIR not in sys.path:
     sys.path.insert(0, AGENT_DIR)
 
 
+# Sample Python files with various issues: unused import, f-string without
+# placeholders, trailing whitespace, comparison to None
+TEMP_REPO_FILES = {
+    "src/unused.py": "import os\nimport json\nprint('hello')\n",
+    "src/fstring.py": "msg = f'static'\nprint(msg)\n",
+    "src/whitespace.py": "x = 1 \ny = 2  \n",
+    "src/compare.py": "def check(val):\n    if val == None:\n        return True\n",
+}
+
+
 @pytest.fixture
-def temp_repo():
+def temp_repo(tmp_path):
     """Create a temporary test repository"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create sample Python files with various issues
-        os.makedirs(os.path.join(tmpdir, "src"), exist_ok=True)
-        
-        # File with unused import
-        with open(os.path.join(tmpdir, "src", "unused.py"), "w") as f:
-            f.write("import os\nimport json\nprint('hello')\n")
-        
-        # File with f-string issue
-        with open(os.path.join(tmpdir, "src", "fstring.py"), "w") as f:
-            f.write("msg = f'static'\nprint(msg)\n")
-        
-        # File with trailing whitespace
-        with open(os.path.join(tmpdir, "src", "whitespace.py"), "w") as f:
-            f.write("x = 1 \ny = 2  \n")
-        
-        # File with comparison to None
-        with open(os.path.join(tmpdir, "src", "compare.py"), "w") as f:
-            f.write("def check(val):\n    if val == None:\n        return True\n")
-        
-        yield tmpdir
+    (tmp_path / "src").mkdir()
+    for rel_path, content in TEMP_REPO_FILES.items():
+        (tmp_path / rel_path).write_text(content)
+    yield str(tmp_path)
 
 
 @pytest.fixture
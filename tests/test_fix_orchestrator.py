@@ -1,13 +1,7 @@
 """Tests for fix_orchestrator.py"""
 import pytest
-import sys
-import os
-
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-AGENT_DIR = os.path.join(BASE_DIR, "agent")
-if AGENT_DIR not in sys.path:
-    sys.path.insert(0, AGENT_DIR)
 
+# agent/ is put on sys.path by conftest.py
 from fix_orchestrator import FixOrchestrator
 
 
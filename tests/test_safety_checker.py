@@ -1,14 +1,9 @@
 """Tests for safety_checker.py"""
 import pytest
-import sys
 import os
 import tempfile
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-AGENT_DIR = os.path.join(BASE_DIR, "agent")
-if AGENT_DIR not in sys.path:
-    sys.path.insert(0, AGENT_DIR)
-
+# agent/ is put on sys.path by conftest.py
 from safety_checker import SafetyChecker
 
 